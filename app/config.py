@@ -25,9 +25,18 @@ class Settings(BaseSettings):
     gemini_retry_min_wait: float = 1.0
     gemini_retry_max_wait: float = 30.0
 
+    # ── Concurrency ───────────────────────────────────────────────────────────
+    # Most Gemini calls one request fans out at once (HTML production). Each
+    # request runs on one of Starlette's 40 worker threads, so the process-wide
+    # ceiling is roughly 40x this. 4 covers a typical 3-5 email campaign in one
+    # or two rounds without a 10-email request opening 10 connections.
+    gemini_max_concurrency: int = 4
+
     # ── App ───────────────────────────────────────────────────────────────────
     app_name: str = "Mark – AI Campaign Generator"
     app_version: str = "1.0.0"
+    log_level: str = "INFO"
+    log_format: str = "text"  # "text" or "json"
     # ── Email / SendGrid ──────────────────────────────────────────────────────
     sendgrid_api_key: str = ""
     email_from: str = ""
@@ -0,0 +1,59 @@
+"""
+app/logging_config.py – logging setup and per-request log context.
+"""
+from __future__ import annotations
+
+import logging
+from contextvars import ContextVar
+from typing import Any
+
+import orjson
+
+from app.config import settings
+
+# Set by the request middleware for the lifetime of each HTTP request; copied
+# into threadpool workers by Starlette, so sync handlers see it too.
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+
+class RequestIDFilter(logging.Filter):
+    """Stamp every record with the current request ID (unless passed via extra)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            record.request_id = request_id_var.get()
+        return True
+
+
+# Attributes every LogRecord has; anything else on a record came from extra={...}.
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line, serialised with orjson; extra={...} keys are inlined."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
+def configure_logging() -> None:
+    handler = logging.StreamHandler()
+    if settings.log_format.lower() == "json":
+        handler.setFormatter(JSONFormatter())
+    else:
+        handler.setFormatter(
+            logging.Formatter("%(levelname)s %(name)s [%(request_id)s] – %(message)s")
+        )
+    handler.addFilter(RequestIDFilter())
+    logging.basicConfig(level=settings.log_level.upper(), handlers=[handler])
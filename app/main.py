@@ -4,45 +4,143 @@ app/main.py – FastAPI entry point for Mark API.
 from __future__ import annotations
 
 import logging
-import uuid
+import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import settings
+from app.logging_config import configure_logging, request_id_var
 from app.routes.campaigns import router as campaigns_router
 from app.routes.email import router as email_router
+from app.routes.health import router as health_router
+from app.services.gemini_client import close_gemini_client
 
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(levelname)s %(name)s – %(message)s",
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
-# ── Minimal request-ID middleware (echoes X-Request-ID for tracing) ───────────
+# ── Request middleware (CORS + X-Request-ID in one ASGI frame) ───────────────
+
+# CORS policy is allow-all (any origin, method and header), so every header
+# except the mirrored Access-Control-Allow-Headers is fixed and built once.
+_CORS_PREFLIGHT_HEADERS: list[tuple[bytes, bytes]] = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"),
+    (b"access-control-max-age", b"86400"),
+]
+_CORS_ALLOW_ANY_ORIGIN = (b"access-control-allow-origin", b"*")
+_VARY_ORIGIN = (b"vary", b"Origin")
+
+# Docs assets and probes still get X-Request-ID, but skip binding the log context.
+_NO_LOG_CONTEXT_PATHS = frozenset(
+    {"/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json", "/healthz", "/readyz"}
+)
+
+
+class RequestMiddleware:
+    """
+    Pure ASGI middleware combining the allow-all CORS policy with request-ID
+    tracing.
+
+    - Answers CORS preflight requests directly.
+    - Stores the request ID on ``request.state`` and adds X-Request-ID /
+      X-Response-Time-ms headers to the response.
+
+    One frame instead of CORSMiddleware + a separate request-ID middleware,
+    and no BaseHTTPMiddleware Request/Response wrapping.
+    """
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request.state.request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request.state.request_id
-        return response
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        rid = origin = acr_method = acr_headers = b""
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                rid = value
+            elif name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                acr_method = value
+            elif name == b"access-control-request-headers":
+                acr_headers = value
+            elif name == b"cookie":
+                has_cookie = True
+        if not rid:
+            rid = os.urandom(16).hex().encode()
+        request_id = rid.decode("latin-1")
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        if scope["method"] == "OPTIONS" and origin and acr_method:
+            headers = list(_CORS_PREFLIGHT_HEADERS)
+            if acr_headers:
+                headers.append((b"access-control-allow-headers", acr_headers))
+            headers.append((b"x-request-id", rid))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if origin:
+                    # Credentialed requests must see the explicit origin, not "*".
+                    if has_cookie:
+                        headers.append((b"access-control-allow-origin", origin))
+                        headers.append(_VARY_ORIGIN)
+                    else:
+                        headers.append(_CORS_ALLOW_ANY_ORIGIN)
+                headers.append((b"x-request-id", rid))
+                elapsed = f"{(time.perf_counter() - start) * 1000:.1f}".encode()
+                headers.append((b"x-response-time-ms", elapsed))
+                message["headers"] = headers
+            await send(message)
+
+        if scope["path"] in _NO_LOG_CONTEXT_PATHS:
+            await self.app(scope, receive, send_wrapper)
+            return
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_var.reset(token)
 
 
 # ── App ───────────────────────────────────────────────────────────────────────
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Build the OpenAPI schema once at startup; FastAPI caches it on
+    # app.openapi_schema, so the first /docs or /openapi.json hit is not slow.
+    app.openapi()
+    yield
+    close_gemini_client()
+
+
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
-app.add_middleware(RequestIDMiddleware)
+app.add_middleware(RequestMiddleware)
 
 app.include_router(campaigns_router)
 app.include_router(email_router)
+app.include_router(health_router)
@@ -6,7 +6,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ── Enumerations ──────────────────────────────────────────────────────────────
@@ -137,6 +137,47 @@ class Deliverables(BaseModel):
 # ── Main Request ──────────────────────────────────────────────────────────────
 
 
+# Module-level so it is built once and shared by the JSON schema / OpenAPI docs.
+_CAMPAIGN_REQUEST_EXAMPLE: dict[str, Any] = {
+    "campaign_name": "Christmas Discount 2025",
+    "brand": {
+        "brand_name": "AcmeCorp",
+        "voice_guidelines": "Warm, festive, friendly. Use inclusive language. Avoid buzzwords.",
+        "banned_phrases": ["world-class", "revolutionary", "synergy"],
+        "required_phrases": ["Shop now", "Limited time offer"],
+        "legal_footer": "© 2025 AcmeCorp Inc. | Unsubscribe | Privacy Policy",
+        "design_tokens": {
+            "primary_color": "#B22222",
+            "secondary_color": "#FFFFFF",
+            "accent_color": "#FFD700",
+            "font_family_heading": "Georgia, serif",
+            "font_family_body": "Arial, sans-serif",
+        },
+    },
+    "objective": {
+        "primary_kpi": "revenue",
+        "secondary_kpis": ["open_rate", "click_through_rate"],
+        "target_audience": "Existing customers who purchased in the last 12 months",
+        "offer": "25% off storewide for Christmas",
+        "geo_scope": "United States",
+        "language": "English",
+    },
+    "constraints": {
+        "discount_ceiling": 25.0,
+        "compliance_notes": "CAN-SPAM compliant. No misleading subject lines.",
+        "send_window": "December 18-24, 2025",
+        "exclude_segments": ["unsubscribed", "bounced"],
+        "required_segments": ["active customers"],
+    },
+    "channels": ["email"],
+    "deliverables": {
+        "number_of_emails": 3,
+        "include_html": True,
+        "include_variants": True,
+    },
+}
+
+
 class CampaignRequest(BaseModel):
     campaign_name: str = Field(..., min_length=1, examples=["Christmas Sale 2025"])
     brand: BrandContext
@@ -149,55 +190,18 @@ class CampaignRequest(BaseModel):
     )
     deliverables: Deliverables
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "campaign_name": "Christmas Discount 2025",
-                    "brand": {
-                        "brand_name": "AcmeCorp",
-                        "voice_guidelines": "Warm, festive, friendly. Use inclusive language. Avoid buzzwords.",
-                        "banned_phrases": ["world-class", "revolutionary", "synergy"],
-                        "required_phrases": ["Shop now", "Limited time offer"],
-                        "legal_footer": "© 2025 AcmeCorp Inc. | Unsubscribe | Privacy Policy",
-                        "design_tokens": {
-                            "primary_color": "#B22222",
-                            "secondary_color": "#FFFFFF",
-                            "accent_color": "#FFD700",
-                            "font_family_heading": "Georgia, serif",
-                            "font_family_body": "Arial, sans-serif",
-                        },
-                    },
-                    "objective": {
-                        "primary_kpi": "revenue",
-                        "secondary_kpis": ["open_rate", "click_through_rate"],
-                        "target_audience": "Existing customers who purchased in the last 12 months",
-                        "offer": "25% off storewide for Christmas",
-                        "geo_scope": "United States",
-                        "language": "English",
-                    },
-                    "constraints": {
-                        "discount_ceiling": 25.0,
-                        "compliance_notes": "CAN-SPAM compliant. No misleading subject lines.",
-                        "send_window": "December 18-24, 2025",
-                        "exclude_segments": ["unsubscribed", "bounced"],
-                        "required_segments": ["active customers"],
-                    },
-                    "channels": ["email"],
-                    "deliverables": {
-                        "number_of_emails": 3,
-                        "include_html": True,
-                        "include_variants": True,
-                    },
-                }
-            ]
-        }
-    }
+    model_config = {"json_schema_extra": {"examples": [_CAMPAIGN_REQUEST_EXAMPLE]}}
 
 
 # ── Sub-models: Response ──────────────────────────────────────────────────────
 
 
+# Response-only models are built once by the service layer and never mutated
+# (updates go through model_copy), so they can be frozen and reject extras.
+# PhaseTimings is excluded: the orchestrator fills it in phase by phase.
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+
 class ClarificationQuestion(BaseModel):
     field: str = Field(..., examples=["objective.offer"])
     question: str = Field(..., examples=["What specific discount or value are you offering?"])
@@ -205,6 +209,8 @@ class ClarificationQuestion(BaseModel):
 
 
 class Blueprint(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     campaign_angle: str
     core_narrative: str
     offer_logic: str
@@ -222,6 +228,8 @@ class Blueprint(BaseModel):
 
 
 class EmailAsset(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     email_number: int
     email_name: str = Field(description="Descriptive name, e.g. 'Teaser – Day 1'")
     subject_lines: list[str] = Field(
@@ -241,6 +249,8 @@ class EmailAsset(BaseModel):
 
 
 class CritiqueResult(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     issues: list[str] = Field(description="Identified issues in copy or strategy.")
     fixes: list[str] = Field(description="Suggested corrections for each issue.")
     risk_flags: list[str] = Field(
@@ -261,6 +271,8 @@ class PhaseTimings(BaseModel):
 
 
 class ResponseMetadata(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     request_id: str
     model_used: str
     tokens_estimate: int = Field(default=0)
@@ -268,6 +280,8 @@ class ResponseMetadata(BaseModel):
 
 
 class CampaignResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     status: CampaignStatus
     clarification_questions: list[ClarificationQuestion] = Field(default_factory=list)
     blueprint: Optional[Blueprint] = None
@@ -280,6 +294,8 @@ class CampaignResponse(BaseModel):
 
 
 class ValidationIssue(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     field: str
     severity: str = Field(examples=["error", "warning", "info"])
     message: str
@@ -287,6 +303,8 @@ class ValidationIssue(BaseModel):
 
 
 class ValidationResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     valid: bool
     issues: list[ValidationIssue] = Field(default_factory=list)
     recommendations: list[str] = Field(default_factory=list)
@@ -296,6 +314,8 @@ class ValidationResponse(BaseModel):
 
 
 class HealthResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     status: str
     version: str
     model: str
@@ -303,6 +323,8 @@ class HealthResponse(BaseModel):
 
 
 class ReadinessResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
+
     ready: bool
     checks: dict[str, Any]
 
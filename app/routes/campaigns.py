@@ -3,11 +3,14 @@ app/routes/campaigns.py – campaign generation and validation endpoints.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
 import uuid
+from collections import Counter
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
 
 from app.models import (
     BrandContext,
@@ -32,8 +35,9 @@ from app.models import (
     ValidationResponse,
 )
 from app.services.gemini_client import GeminiClient, get_gemini_client
+from app.services.html_extract import extract_html, strip_fences
 from app.services.orchestrator import orchestrate_campaign, orchestrate_campaign_fast
-from app.services.cache import campaign_cache
+from app.services.cache import campaign_cache, model_key, prompt_cache
 from app.services import prompting
 from app.services.validators import validate_campaign_request
 
@@ -43,75 +47,42 @@ router = APIRouter(prefix="/v1/campaigns", tags=["Campaigns"])
 
 
 def _get_request_id(request: Request) -> str:
-    return request.state.request_id if hasattr(request.state, "request_id") else str(uuid.uuid4())
-
-
-def _extract_html_from_text(raw: str) -> str:
-    """Strip fences / leading prose and return the first complete HTML document."""
-    import json as _json
-
-    text = raw.strip()
-    for fence in ("```html", "```json", "```"):
-        if text.startswith(fence):
-            text = text[len(fence):].lstrip("\n")
-            break
-    if text.endswith("```"):
-        text = text[:-3].rstrip()
-    text = text.strip()
-    # If the model wrapped the HTML in a JSON object, unwrap it.
-    if text.startswith("{"):
-        try:
-            obj = _json.loads(text)
-            if isinstance(obj, dict):
-                for val in obj.values():
-                    if isinstance(val, str) and ("<html" in val.lower() or "<!doctype" in val.lower()):
-                        text = val  # json.loads already unescapes \\n → \n etc.
-                        break
-        except (_json.JSONDecodeError, ValueError):
-            # Strict parse failed — try JSON-string-aware regex on the email_html value.
-            html_val_match = re.search(
-                r'"email_html"\s*:\s*"((?:[^"\\]|\\.)*)',
-                text,
-                re.DOTALL,
-            )
-            if html_val_match:
-                raw_val = html_val_match.group(1)
-                if raw_val.endswith('"'):
-                    raw_val = raw_val[:-1]
-                try:
-                    text = _json.loads('"' + raw_val + '"')
-                except _json.JSONDecodeError:
-                    text = (
-                        raw_val
-                        .replace('\\"', '"')
-                        .replace('\\n', '\n')
-                        .replace('\\r', '\r')
-                        .replace('\\t', '\t')
-                        .replace('\\\\', '\\')
-                    )
-    m = re.search(r"(<!DOCTYPE\s+html[\s\S]*?</html>)", text, re.IGNORECASE)
-    if m:
-        return m.group(1)
-    m2 = re.search(r"(<html[\s\S]*?</html>)", text, re.IGNORECASE)
-    if m2:
-        return m2.group(1)
-    return text
+    return getattr(request.state, "request_id", None) or str(uuid.uuid4())
 
 
 # ── helpers ───────────────────────────────────────────────────────────────────
 
 
+# Prompt-cache misses currently being generated, keyed like prompt_cache, so
+# concurrent identical prompts share one parse + pipeline run.
+_inflight: dict[int, asyncio.Future[SimpleCampaignResponse]] = {}
+
+
+class _LeaderCancelled(Exception):
+    """Set on an in-flight future when the request running it was cancelled
+    (client disconnect); followers then generate for themselves."""
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Collapse whitespace runs and case-fold, for use in cache keys only."""
+    return " ".join(prompt.split()).casefold()
+
+
+# Shared by every edit-email response; never mutated.
+_EMPTY_SUMMARY = SimpleSummary()
+
+_KPI_BY_VALUE: dict[str, PrimaryKPI] = {k.value: k for k in PrimaryKPI}
+
+
 def _build_campaign_request(parsed: dict, brand_context: dict | None = None) -> CampaignRequest:
     """Reconstruct a CampaignRequest from the parse-phase output dict.
 
     If ``brand_context`` is supplied (from the frontend brand store) its values
     take precedence over whatever Gemini parsed from the free-form prompt.
     """
-    raw_kpi = parsed.get("primary_kpi", "revenue")
-    try:
-        kpi = PrimaryKPI(raw_kpi)
-    except ValueError:
-        kpi = PrimaryKPI.REVENUE
+    # Dict lookup instead of PrimaryKPI(raw) + try/except; str() guards against
+    # unhashable values in the model output.
+    kpi = _KPI_BY_VALUE.get(str(parsed.get("primary_kpi", "revenue")), PrimaryKPI.REVENUE)
 
     # ── Brand: frontend store wins over prompt-parsed values ─────────────────
     bc = brand_context or {}
@@ -170,38 +141,42 @@ def _map_to_simple_response(
     request_id: str,
 ) -> SimpleCampaignResponse:
     """Map the full CampaignResponse to the lean shape the frontend expects."""
+    # The summary depends only on the request, so build it once and share it
+    # across every email (response models are never mutated after this point).
+    compliance = " | ".join(filter(None, [
+        campaign_req.constraints.compliance_notes,
+        campaign_req.brand.legal_footer,
+    ])) or "Standard compliance applied."
+    summary = SimpleSummary(
+        target_group=campaign_req.objective.target_audience,
+        regional_adaptation=(
+            f"{campaign_req.objective.geo_scope}"
+            + (f" — {campaign_req.constraints.send_window}"
+               if campaign_req.constraints.send_window else "")
+        ),
+        tone_decision=campaign_req.brand.voice_guidelines[:150],
+        legal_considerations=compliance,
+    )
+
     emails: list[SimpleEmail] = []
     for asset in campaign_resp.assets:
-        compliance = " | ".join(filter(None, [
-            campaign_req.constraints.compliance_notes,
-            campaign_req.brand.legal_footer,
-        ])) or "Standard compliance applied."
-
         raw_html = asset.html or ""
-        logger.info(
-            "[HTML step 3/3] Mapping email %d to response — length=%d, "
-            "has_real_newlines=%s, has_literal_backslash_n=%s, first 300 chars: %s",
-            asset.email_number,
-            len(raw_html),
-            repr("\n" in raw_html),
-            repr("\\n" in raw_html),
-            repr(raw_html[:300]),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[HTML step 3/3] Mapping email %d to response — length=%d, "
+                "has_real_newlines=%s, has_literal_backslash_n=%s, first 300 chars: %s",
+                asset.email_number,
+                len(raw_html),
+                "\n" in raw_html,
+                "\\n" in raw_html,
+                repr(raw_html[:300]),
+            )
         emails.append(
             SimpleEmail(
                 id=f"email-{asset.email_number}",
                 subject=asset.subject_lines[0] if asset.subject_lines else asset.email_name,
                 html_content=raw_html,
-                summary=SimpleSummary(
-                    target_group=campaign_req.objective.target_audience,
-                    regional_adaptation=(
-                        f"{campaign_req.objective.geo_scope}"
-                        + (f" — {campaign_req.constraints.send_window}"
-                           if campaign_req.constraints.send_window else "")
-                    ),
-                    tone_decision=campaign_req.brand.voice_guidelines[:150],
-                    legal_considerations=compliance,
-                ),
+                summary=summary,
             )
         )
     return SimpleCampaignResponse(
@@ -234,9 +209,58 @@ async def generate_from_prompt(
     request_id = _get_request_id(request)
     logger.info("POST /generate-from-prompt", extra={"request_id": request_id})
 
+    # ── Identical prompt seen recently → skip the parse round-trip entirely ──
+    # Case/whitespace-insensitive: trivially different retypes share an entry.
+    prompt_key = model_key(payload.model_copy(update={"prompt": _normalize_prompt(payload.prompt)}))
+    cached = prompt_cache.get(prompt_key)
+    if cached is not None:
+        logger.info("Prompt cache hit", extra={"request_id": request_id})
+        return cached
+
+    # ── Same prompt already being generated → wait for that result ──────────
+    while (pending := _inflight.get(prompt_key)) is not None:
+        logger.info("Joining in-flight generation", extra={"request_id": request_id})
+        try:
+            return await asyncio.shield(pending)
+        except _LeaderCancelled:
+            # The leader's own client went away; that must not fail this
+            # request. The first woken follower takes over as the new leader.
+            logger.info("In-flight leader cancelled; retrying", extra={"request_id": request_id})
+
+    # No await between the lookup above and this insert, so the single event
+    # loop needs no lock around _inflight.
+    future: asyncio.Future[SimpleCampaignResponse] = asyncio.get_running_loop().create_future()
+    _inflight[prompt_key] = future
+    try:
+        result = await _generate_uncached(payload, request_id, client, prompt_key)
+    except asyncio.CancelledError:
+        future.set_exception(_LeaderCancelled())
+        future.exception()  # mark retrieved, as below
+        raise
+    except BaseException as exc:
+        future.set_exception(exc)
+        future.exception()  # mark retrieved: no "never retrieved" warning without followers
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _inflight.pop(prompt_key, None)
+
+
+async def _generate_uncached(
+    payload: PromptRequest,
+    request_id: str,
+    client: GeminiClient,
+    prompt_key: int,
+) -> SimpleCampaignResponse:
+    """Parse the prompt and run the fast pipeline (prompt-cache miss path)."""
     # ── Phase 0: parse free-form prompt ───────────────────────────────────────
+    # Gemini calls are blocking; run them in the threadpool so the event loop
+    # keeps serving other requests during the round-trip.
     try:
-        parse_result = client.generate_text(
+        parse_result = await run_in_threadpool(
+            client.generate_text,
             prompt=prompting.build_parse_prompt(payload.prompt, force_proceed=payload.force_proceed),
             system_instruction=prompting.SHARED_SYSTEM_INSTRUCTION,
             json_schema=prompting.PARSE_SCHEMA,
@@ -250,12 +274,14 @@ async def generate_from_prompt(
 
     # Needs clarification → return questions to frontend
     if parsed.get("needs_clarification"):
+        # Structured output follows PARSE_SCHEMA; only guard the item shape.
         questions = [
-            SimpleClarificationQuestion(
+            SimpleClarificationQuestion.model_construct(
                 field=q.get("field", ""),
                 question=q.get("question", ""),
             )
             for q in (parsed.get("questions") or [])
+            if isinstance(q, dict)
         ]
         return SimpleCampaignResponse(
             id=request_id,
@@ -271,14 +297,16 @@ async def generate_from_prompt(
         raise HTTPException(status_code=422, detail=f"Could not parse campaign fields: {exc}") from exc
 
     # ── Check cache first ─────────────────────────────────────────────────
-    cache_key = campaign_req.model_dump()
+    cache_key = model_key(campaign_req)
     cached = campaign_cache.get(cache_key)
     if cached is not None:
         logger.info("Cache hit", extra={"request_id": request_id})
+        prompt_cache.set(prompt_key, cached)
         return cached
 
     try:
-        campaign_resp = orchestrate_campaign_fast(
+        campaign_resp = await run_in_threadpool(
+            orchestrate_campaign_fast,
             req=campaign_req,
             request_id=request_id,
             client=client,
@@ -291,8 +319,9 @@ async def generate_from_prompt(
 
     # Handle LLM-requested clarification from phase 1
     if campaign_resp.status.value == "needs_clarification":
+        # Already validated as ClarificationQuestion models.
         questions = [
-            SimpleClarificationQuestion(field=q.field, question=q.question)
+            SimpleClarificationQuestion.model_construct(field=q.field, question=q.question)
             for q in campaign_resp.clarification_questions
         ]
         return SimpleCampaignResponse(
@@ -303,6 +332,7 @@ async def generate_from_prompt(
 
     result = _map_to_simple_response(campaign_req, campaign_resp, request_id)
     campaign_cache.set(cache_key, result)
+    prompt_cache.set(prompt_key, result)
     return result
 
 
@@ -321,8 +351,10 @@ async def edit_email(
     request_id = _get_request_id(request)
     logger.info("POST /edit-email", extra={"request_id": request_id, "email_id": payload.email_id})
 
+    # generate_text blocks on network I/O; run it off the event loop.
     try:
-        result = client.generate_text(
+        result = await run_in_threadpool(
+            client.generate_text,
             prompt=prompting.build_edit_email_prompt(
                 current_html=payload.current_html,
                 subject=payload.subject,
@@ -338,19 +370,20 @@ async def edit_email(
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
     edit_raw_text = result.get("text", "")
-    html = (result.get("parsed") or {}).get("email_html") or _extract_html_from_text(edit_raw_text)
-    logger.info(
-        "[edit-email] Resolved html — length=%d, source=%s, first 120 chars: %s",
-        len(html),
-        "parsed" if (result.get("parsed") or {}).get("email_html") else "fallback_extract",
-        repr(html[:120]),
-    )
+    html = (result.get("parsed") or {}).get("email_html") or extract_html(edit_raw_text)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "[edit-email] Resolved html — length=%d, source=%s, first 120 chars: %s",
+            len(html),
+            "parsed" if (result.get("parsed") or {}).get("email_html") else "fallback_extract",
+            repr(html[:120]),
+        )
 
     updated_email = SimpleEmail(
         id=payload.email_id,
         subject=payload.subject,
         html_content=html,
-        summary=SimpleSummary(),  # summary unchanged for edits
+        summary=_EMPTY_SUMMARY,  # summary unchanged for edits
     )
     return EmailEditResponse(email=updated_email)
 
@@ -373,11 +406,13 @@ async def edit_email(
         503: {"description": "Gemini API unavailable."},
     },
 )
-async def generate_campaign(
+def generate_campaign(
     payload: CampaignRequest,
     request: Request,
     client: GeminiClient = Depends(get_gemini_client),
 ) -> CampaignResponse:
+    # Sync handler: FastAPI runs it in the threadpool, so the blocking
+    # orchestrator pipeline does not stall the event loop.
     request_id = _get_request_id(request)
     logger.info(
         "POST /generate",
@@ -388,15 +423,15 @@ async def generate_campaign(
     )
 
     # Pre-generation field validation
-    pre_issues = validate_campaign_request(payload)
-    errors = [i for i in pre_issues if i.severity == "error"]
+    errors = [
+        {"field": i.field, "message": i.message, "suggestion": i.suggestion}
+        for i in validate_campaign_request(payload)
+        if i.severity == "error"
+    ]
     if errors:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=[
-                {"field": i.field, "message": i.message, "suggestion": i.suggestion}
-                for i in errors
-            ],
+            detail=errors,
         )
 
     try:
@@ -446,12 +481,15 @@ async def validate_campaign(
 
     issues: list[ValidationIssue] = validate_campaign_request(payload)
 
+    # One pass over the issues builds both tallies.
+    counts = Counter(i.severity for i in issues)
+    error_count = counts["error"]
+    warn_count = counts["warning"]
+
     recommendations: list[str] = []
     if not issues:
         recommendations.append("Request appears complete. Ready to generate.")
     else:
-        error_count = sum(1 for i in issues if i.severity == "error")
-        warn_count = sum(1 for i in issues if i.severity == "warning")
         if error_count:
             recommendations.append(
                 f"Fix {error_count} error(s) before generating to avoid failures."
@@ -462,7 +500,7 @@ async def validate_campaign(
             )
 
     return ValidationResponse(
-        valid=not any(i.severity == "error" for i in issues),
+        valid=error_count == 0,
         issues=issues,
         recommendations=recommendations,
     )
@@ -530,7 +568,7 @@ Return ONLY valid JSON — no code fences, no prose — in exactly this shape:
 """
 
     try:
-        result = client.generate_text(prompt=prompt)
+        result = await run_in_threadpool(client.generate_text, prompt=prompt)
     except Exception as exc:
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
@@ -539,16 +577,8 @@ Return ONLY valid JSON — no code fences, no prose — in exactly this shape:
 
     # Try parsed first, then fall back to text extraction
     if not isinstance(parsed.get("assignments"), dict):
-        import json as _json
         try:
-            # Strip possible markdown fences
-            clean = raw_text.strip()
-            for fence in ("```json", "```"):
-                if clean.startswith(fence):
-                    clean = clean[len(fence):].lstrip("\n")
-            if clean.endswith("```"):
-                clean = clean[:-3].rstrip()
-            parsed = _json.loads(clean)
+            parsed = orjson.loads(strip_fences(raw_text))
         except Exception:
             parsed = {}
 
@@ -8,6 +8,7 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, EmailStr, model_validator
+from starlette.concurrency import run_in_threadpool
 
 from app.config import settings
 from app.services.email_client import EmailSendError, send_email
@@ -63,8 +64,10 @@ async def send_email_endpoint(payload: SendEmailRequest) -> SendEmailResponse:
 
     Requires **to**, **subject**, and at least one of **text** or **html**.
     """
+    # send_email is a blocking HTTPS call; keep it off the event loop.
     try:
-        send_email(
+        await run_in_threadpool(
+            send_email,
             to_email=payload.to,
             subject=payload.subject,
             html=payload.html,
@@ -15,6 +15,24 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Health"])
 
 
+# Both probes depend only on startup configuration, so the answers are built
+# once at import instead of on every orchestrator poll.
+_HEALTHZ = HealthResponse(
+    status="ok",
+    version=settings.app_version,
+    model=settings.gemini_model,
+    gemini_key_configured=bool(settings.gemini_api_key),
+)
+
+_READYZ = ReadinessResponse(
+    ready=bool(settings.gemini_api_key),
+    checks={
+        "gemini_api_key_configured": bool(settings.gemini_api_key),
+        "gemini_model": settings.gemini_model or "NOT SET",
+    },
+)
+
+
 @router.get(
     "/healthz",
     response_model=HealthResponse,
@@ -22,12 +40,7 @@ router = APIRouter(tags=["Health"])
     description="Returns 200 as long as the application process is running.",
 )
 async def healthz() -> HealthResponse:
-    return HealthResponse(
-        status="ok",
-        version=settings.app_version,
-        model=settings.gemini_model,
-        gemini_key_configured=bool(settings.gemini_api_key),
-    )
+    return _HEALTHZ
 
 
 @router.get(
@@ -40,15 +53,4 @@ async def healthz() -> HealthResponse:
     ),
 )
 async def readyz() -> ReadinessResponse:
-    checks: dict = {}
-
-    # Check Gemini API key
-    key_ok = bool(settings.gemini_api_key)
-    checks["gemini_api_key_configured"] = key_ok
-
-    # Check model config
-    checks["gemini_model"] = settings.gemini_model or "NOT SET"
-
-    ready = key_ok
-
-    return ReadinessResponse(ready=ready, checks=checks)
+    return _READYZ
@@ -1,30 +1,63 @@
 """
 app/services/cache.py – simple in-memory TTL cache for campaign responses.
 
-Keyed by a SHA-256 hash of the serialised CampaignRequest. Entries expire
-after `ttl_seconds` (default 15 minutes). No external dependencies required.
+Keyed by a 64-bit integer BLAKE2b digest of the key data (the raw prompt request or
+the parsed CampaignRequest). Entries expire after `ttl_seconds` (default 15
+minutes); beyond `max_items` the least recently used entry is evicted, so
+memory stays bounded. No external dependencies required.
 """
 from __future__ import annotations
 
 import hashlib
-import json
 import time
+from collections import OrderedDict, deque
 from typing import Any, Optional
 
+import orjson
+from pydantic import BaseModel
+
+
+def _digest(raw: bytes) -> int:
+    # 64-bit int keys: cheapest possible dict hashing and equality checks.
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "little")
+
+
+def model_key(model: BaseModel) -> int:
+    """Digest a Pydantic model's JSON form (Rust serializer, stable field order)."""
+    return _digest(model.__pydantic_serializer__.to_json(model))
+
 
 class TTLCache:
-    """Minimal in-memory key/value store with per-entry TTL."""
+    """Minimal in-memory key/value store with per-entry TTL and an LRU size cap.
+
+    Shared between the event loop and threadpool workers without a lock: each
+    OrderedDict operation is atomic under the GIL, and every removal goes
+    through ``pop(key, None)`` (or tolerates ``KeyError``), so a concurrent
+    delete of the same key is a no-op rather than an exception.
+    """
 
-    def __init__(self, ttl_seconds: int = 900) -> None:
-        self._store: dict[str, tuple[Any, float]] = {}
+    def __init__(self, ttl_seconds: int = 900, max_items: int = 256) -> None:
+        self._store: OrderedDict[int, tuple[Any, float]] = OrderedDict()
         self._ttl = ttl_seconds
+        self._max_items = max_items
+        # (expires_at, key) in insertion order; with one TTL per cache this is
+        # also expiry order, so set() can sweep expired entries from the left.
+        self._expiry: deque[tuple[float, int]] = deque()
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
     @staticmethod
-    def _hash(data: Any) -> str:
-        raw = json.dumps(data, sort_keys=True, default=str)
-        return hashlib.sha256(raw.encode()).hexdigest()
+    def _hash(data: Any) -> int:
+        if type(data) is int:  # already a digest, e.g. from model_key()
+            return data
+        if type(data) is bytes:  # already canonical, e.g. Pydantic to_json()
+            return _digest(data)
+        raw = orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+        return _digest(raw)
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -36,21 +69,57 @@ class TTLCache:
             return None
         value, expires_at = entry
         if time.monotonic() > expires_at:
-            del self._store[key]
+            self._store.pop(key, None)
             return None
+        try:
+            self._store.move_to_end(key)
+        except KeyError:  # evicted by another thread since the lookup
+            pass
         return value
 
     def set(self, key_data: Any, value: Any) -> None:
         """Store a value with the configured TTL."""
         key = self._hash(key_data)
-        self._store[key] = (value, time.monotonic() + self._ttl)
+        now = time.monotonic()
+        self._sweep(now)
+        expires_at = now + self._ttl
+        self._store[key] = (value, expires_at)
+        try:
+            self._store.move_to_end(key)
+        except KeyError:  # evicted by another thread since the assignment
+            pass
+        self._expiry.append((expires_at, key))
+        while len(self._store) > self._max_items:
+            try:
+                self._store.popitem(last=False)
+            except KeyError:  # emptied concurrently
+                break
 
     def clear(self) -> None:
         self._store.clear()
+        self._expiry.clear()
+
+    def _sweep(self, now: float) -> None:
+        """Drop entries whose TTL has passed, even if they are never read again."""
+        expiry = self._expiry
+        while expiry and expiry[0][0] < now:
+            try:
+                expires_at, key = expiry.popleft()
+            except IndexError:  # drained by a concurrent sweep
+                break
+            entry = self._store.get(key)
+            # Skip keys that were re-set (newer expiry) or already evicted.
+            if entry is not None and entry[1] == expires_at:
+                self._store.pop(key, None)
 
     def __len__(self) -> int:
         return len(self._store)
 
 
-# Module-level singleton – shared across all requests in a process.
+# Module-level singletons – shared across all requests in a process.
+# prompt_cache is checked before the Phase-0 parse call; campaign_cache after it.
+# phase_cache holds parsed outputs of the low-temperature orchestrator phases
+# (clarify, research+strategy), keyed by (phase, model, request digest).
+prompt_cache = TTLCache(ttl_seconds=900)
 campaign_cache = TTLCache(ttl_seconds=900)
+phase_cache = TTLCache(ttl_seconds=900)
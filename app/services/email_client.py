@@ -7,8 +7,9 @@ this module entirely).
 """
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Optional
+from typing import Any, Optional
 
 from app.config import settings
 
@@ -26,6 +27,19 @@ class EmailSendError(RuntimeError):
         self.__cause__ = cause
 
 
+# ── Client cache ──────────────────────────────────────────────────────────────
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(client_cls: type, api_key: str) -> Any:
+    """Return a SendGridAPIClient reused across sends for the same API key.
+
+    Keyed on the class too so a re-imported (or mocked) sendgrid module gets a
+    fresh client rather than a stale one.
+    """
+    return client_cls(api_key)
+
+
 # ── Public interface ──────────────────────────────────────────────────────────
 
 
@@ -50,34 +64,36 @@ def send_email(
     if not html and not text:
         raise ValueError("At least one of 'html' or 'text' must be provided.")
 
-    if not settings.sendgrid_api_key:
+    api_key = settings.sendgrid_api_key
+    from_email = settings.email_from
+    reply_to = settings.email_reply_to
+    if not api_key:
         raise EmailSendError("SENDGRID_API_KEY is not configured.")
-    if not settings.email_from:
+    if not from_email:
         raise EmailSendError("EMAIL_FROM is not configured.")
 
     # Local import keeps the module importable without sendgrid installed.
     try:
         from sendgrid import SendGridAPIClient
-        from sendgrid.helpers.mail import Mail, Content, To, ReplyTo
+        from sendgrid.helpers.mail import Mail, ReplyTo
     except ImportError as exc:  # pragma: no cover
         raise EmailSendError("sendgrid package is not installed.", cause=exc) from exc
 
+    # Passing both bodies to the constructor lets Mail build its content list
+    # in one go (text/plain first, as SendGrid requires).
     message = Mail(
-        from_email=settings.email_from,
+        from_email=from_email,
         to_emails=to_email,
         subject=subject,
+        plain_text_content=text or None,
+        html_content=html or None,
     )
 
-    if html:
-        message.add_content(Content("text/html", html))
-    if text:
-        message.add_content(Content("text/plain", text))
-
-    if settings.email_reply_to:
-        message.reply_to = ReplyTo(settings.email_reply_to)
+    if reply_to:
+        message.reply_to = ReplyTo(reply_to)
 
     try:
-        sg = SendGridAPIClient(settings.sendgrid_api_key)
+        sg = _get_client(SendGridAPIClient, api_key)
         response = sg.send(message)
         logger.info(
             "Email sent via SendGrid",
@@ -10,11 +10,13 @@ Key design decisions
 """
 from __future__ import annotations
 
-import json
 import logging
+import re
+import threading
 import time
 from typing import Any, Optional
 
+import orjson
 from google import genai
 from google.genai import errors as genai_errors
 from google.genai import types as genai_types
@@ -58,6 +60,24 @@ class GeminiClient:
             )
         self._client = genai.Client(api_key=api_key)
         self._model = settings.gemini_model
+        self._default_temperature = settings.gemini_temperature
+        self._default_max_output_tokens = settings.gemini_max_output_tokens
+        # Retry policy is fixed per client, so wrap the single-attempt call once
+        # per client instance here rather than building a fresh decorator on
+        # every request.
+        self._call_with_retry = retry(
+            retry=retry_if_exception(_is_transient),
+            stop=stop_after_attempt(settings.gemini_retry_attempts),
+            wait=wait_exponential(
+                min=settings.gemini_retry_min_wait,
+                max=settings.gemini_retry_max_wait,
+            ),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True,
+        )(self._execute_once)
+        # Request configs keyed by (system instruction, schema identity,
+        # temperature, max tokens); see _config_for().
+        self._configs: dict[tuple, tuple[Optional[dict], genai_types.GenerateContentConfig]] = {}
         logger.info(
             "GeminiClient initialised",
             extra={"model": self._model},
@@ -103,13 +123,47 @@ class GeminiClient:
             prompt=prompt,
             system_instruction=system_instruction,
             json_schema=json_schema,
-            temperature=temperature or settings.gemini_temperature,
-            max_output_tokens=max_output_tokens or settings.gemini_max_output_tokens,
+            temperature=temperature or self._default_temperature,
+            max_output_tokens=max_output_tokens or self._default_max_output_tokens,
         )
 
-    # ── Internal retry wrapper ─────────────────────────────────────────────────
+    # ── Request config (built once per distinct call shape) ──────────────────
 
-    def _call_with_retry(
+    def _config_for(
+        self,
+        system_instruction: Optional[str],
+        json_schema: Optional[dict],
+        temperature: float,
+        max_output_tokens: int,
+    ) -> genai_types.GenerateContentConfig:
+        """Return the GenerateContentConfig for these settings, building it once.
+
+        Schemas are module-level constants, so they are keyed by identity; the
+        cached entry holds a reference to the schema, and the ``is`` check
+        guards against a recycled id.
+        """
+        key = (system_instruction, id(json_schema), temperature, max_output_tokens)
+        cached = self._configs.get(key)
+        if cached is not None and cached[0] is json_schema:
+            return cached[1]
+
+        config_kwargs: dict[str, Any] = {
+            "temperature": temperature,
+            "max_output_tokens": max_output_tokens,
+        }
+        if system_instruction:
+            config_kwargs["system_instruction"] = system_instruction
+        if json_schema:
+            config_kwargs["response_mime_type"] = "application/json"
+            config_kwargs["response_json_schema"] = json_schema
+
+        config = genai_types.GenerateContentConfig(**config_kwargs)
+        self._configs[key] = (json_schema, config)
+        return config
+
+    # ── Single attempt (wrapped with retries in __init__) ─────────────────────
+
+    def _execute_once(
         self,
         prompt: str,
         system_instruction: Optional[str],
@@ -117,120 +171,102 @@ class GeminiClient:
         temperature: float,
         max_output_tokens: int,
     ) -> dict[str, Any]:
-        """Executes the API call with exponential-backoff retries."""
+        """Make one API call; transient failures are retried by the caller."""
+        config = self._config_for(
+            system_instruction, json_schema, temperature, max_output_tokens
+        )
 
-        @retry(
-            retry=retry_if_exception(_is_transient),
-            stop=stop_after_attempt(settings.gemini_retry_attempts),
-            wait=wait_exponential(
-                min=settings.gemini_retry_min_wait,
-                max=settings.gemini_retry_max_wait,
-            ),
-            before_sleep=before_sleep_log(logger, logging.WARNING),
-            reraise=True,
+        t0 = time.perf_counter()
+        response = self._client.models.generate_content(
+            model=self._model,
+            contents=prompt,
+            config=config,
         )
-        def _execute() -> dict[str, Any]:
-            config_kwargs: dict[str, Any] = {
-                "temperature": temperature,
-                "max_output_tokens": max_output_tokens,
-            }
-            if system_instruction:
-                config_kwargs["system_instruction"] = system_instruction
-            if json_schema:
-                config_kwargs["response_mime_type"] = "application/json"
-                config_kwargs["response_json_schema"] = json_schema
-
-            config = genai_types.GenerateContentConfig(**config_kwargs)
-
-            t0 = time.perf_counter()
-            response = self._client.models.generate_content(
-                model=self._model,
-                contents=prompt,
-                config=config,
-            )
-            latency_ms = (time.perf_counter() - t0) * 1000
-
-            raw_text = response.text or ""
-
-            # Attempt to parse JSON if schema was requested
-            parsed_obj: Optional[Any] = None
-            if json_schema:
-                try:
-                    parsed_obj = json.loads(raw_text)
-                except json.JSONDecodeError as exc:
-                    logger.warning(
-                        "Gemini returned non-JSON despite schema; attempting recovery",
-                        extra={"error": str(exc)},
-                    )
-                    # Best-effort: attempt to extract JSON substring
-                    parsed_obj = _extract_json_fallback(raw_text)
-
-            # Token counting (best-effort; SDK may not always populate this)
-            tokens_used = 0
+        latency_ms = (time.perf_counter() - t0) * 1000
+
+        raw_text = response.text or ""
+
+        # Attempt to parse JSON if schema was requested
+        parsed_obj: Optional[Any] = None
+        if json_schema:
             try:
-                usage = response.usage_metadata
-                if usage:
-                    tokens_used = (usage.prompt_token_count or 0) + (
-                        usage.candidates_token_count or 0
-                    )
-            except AttributeError:
-                pass
-
-            logger.debug(
-                "Gemini call completed",
-                extra={
-                    "model": self._model,
-                    "tokens_used": tokens_used,
-                    "latency_ms": round(latency_ms, 1),
-                    "json_mode": json_schema is not None,
-                },
-            )
+                parsed_obj = orjson.loads(raw_text)
+            except orjson.JSONDecodeError as exc:
+                logger.warning(
+                    "Gemini returned non-JSON despite schema; attempting recovery",
+                    extra={"error": str(exc)},
+                )
+                # Best-effort: attempt to extract JSON substring
+                parsed_obj = _extract_json_fallback(raw_text)
+
+        # Token counting (best-effort; SDK may not always populate this)
+        tokens_used = 0
+        try:
+            usage = response.usage_metadata
+            if usage:
+                tokens_used = (usage.prompt_token_count or 0) + (
+                    usage.candidates_token_count or 0
+                )
+        except AttributeError:
+            pass
 
-            return {
-                "text": raw_text,
-                "parsed": parsed_obj,
+        logger.debug(
+            "Gemini call completed",
+            extra={
                 "model": self._model,
                 "tokens_used": tokens_used,
-                "latency_ms": latency_ms,
-            }
+                "latency_ms": round(latency_ms, 1),
+                "json_mode": json_schema is not None,
+            },
+        )
 
-        return _execute()
+        return {
+            "text": raw_text,
+            "parsed": parsed_obj,
+            "model": self._model,
+            "tokens_used": tokens_used,
+            "latency_ms": latency_ms,
+        }
 
 
 # ── JSON extraction fallback ───────────────────────────────────────────────────
 
 
+# Compiled once; the fallback runs on every malformed structured response.
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.DOTALL)
+_BRACE_BLOCK_RE = re.compile(r"(\{.*\})", re.DOTALL)
+_EMAIL_HTML_RE = re.compile(r'"email_html"\s*:\s*"((?:[^"\\]|\\.)*)"', re.DOTALL)
+
+
 def _extract_json_fallback(text: str) -> Optional[Any]:
     """Try to salvage a JSON object from markdown-wrapped or prefixed text."""
-    import re
-
     # Strip ```json ... ``` fences
-    fence_match = re.search(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", text, re.DOTALL)
+    fence_match = _FENCED_JSON_RE.search(text)
     if fence_match:
         try:
-            return json.loads(fence_match.group(1))
-        except json.JSONDecodeError:
+            return orjson.loads(fence_match.group(1))
+        except orjson.JSONDecodeError:
             pass
 
     # Find the first { … } block and try to parse it
-    brace_match = re.search(r"(\{.*\})", text, re.DOTALL)
+    brace_match = _BRACE_BLOCK_RE.search(text)
     if brace_match:
         try:
-            return json.loads(brace_match.group(1))
-        except json.JSONDecodeError:
+            return orjson.loads(brace_match.group(1))
+        except orjson.JSONDecodeError:
             pass
 
     # Last resort for HTML envelopes: Gemini sometimes produces almost-valid JSON
-    # where the HTML value contains characters that break strict json.loads.
+    # where the HTML value contains characters that break strict JSON parsing.
     # Extract the email_html value directly using a JSON-string-aware regex.
-    html_match = re.search(r'"email_html"\s*:\s*"((?:[^"\\]|\\.)*)"', text, re.DOTALL)
+    html_match = _EMAIL_HTML_RE.search(text)
     if html_match:
         raw_val = html_match.group(1)
         try:
             # Decode JSON string escapes by wrapping in quotes and parsing
-            decoded = json.loads('"' + raw_val + '"')
+            decoded = orjson.loads('"' + raw_val + '"')
             return {"email_html": decoded}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Manual fallback for common escapes
             decoded = (
                 raw_val
@@ -247,12 +283,28 @@ def _extract_json_fallback(text: str) -> Optional[Any]:
 
 # ── Module-level singleton (lazy init) ────────────────────────────────────────
 
+# The SDK keeps one pooled HTTP client (keep-alive connections) per
+# genai.Client, so every call must go through this one instance. The sync
+# dependency runs in threadpool workers, hence the lock: concurrent first
+# requests would otherwise each build a client and a separate pool.
 _client_instance: Optional[GeminiClient] = None
+_client_lock = threading.Lock()
 
 
 def get_gemini_client() -> GeminiClient:
     """Return the shared GeminiClient singleton (created on first call)."""
     global _client_instance
     if _client_instance is None:
-        _client_instance = GeminiClient()
+        with _client_lock:
+            if _client_instance is None:
+                _client_instance = GeminiClient()
     return _client_instance
+
+
+def close_gemini_client() -> None:
+    """Close the singleton's pooled connections (app shutdown)."""
+    global _client_instance
+    with _client_lock:
+        if _client_instance is not None:
+            _client_instance._client.close()
+            _client_instance = None
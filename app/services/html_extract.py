@@ -0,0 +1,83 @@
+"""
+app/services/html_extract.py – recover a complete HTML document from raw model text.
+
+Shared by the production phase (orchestrator) and the edit-email route, for
+when structured output did not yield a usable ``email_html`` value.
+"""
+from __future__ import annotations
+
+import re
+from json.decoder import scanstring
+
+import orjson
+
+# Compiled once at import; used on every HTML extraction.
+_FENCE_OPEN_RE = re.compile(r"\A```(?:html|json)?\n*")
+_EMAIL_HTML_PREFIX_RE = re.compile(r'\{\s*"email_html"\s*:\s*"')
+_EMAIL_HTML_VALUE_RE = re.compile(r'"email_html"\s*:\s*"((?:[^"\\]|\\.)*)', re.DOTALL)
+# Document bounds are found in two forward scans (start, then the first
+# closing tag after it) instead of a lazy [\s\S]*? that re-tests "</html>" at
+# every offset. A DOCTYPE normally precedes <html>, so it wins.
+_HTML_START_RE = re.compile(r"<!DOCTYPE\s+html|<html", re.IGNORECASE)
+_HTML_END_RE = re.compile(r"</html>", re.IGNORECASE)
+# Case-insensitive probe for an HTML document; avoids lower()-copying the value.
+_HTML_MARKER_RE = re.compile(r"<(?:html|!doctype)", re.IGNORECASE)
+_JSON_ESCAPE_RE = re.compile(r'\\([nrt"\\])')
+_JSON_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", '"': '"', "\\": "\\"}
+
+
+def strip_fences(raw: str) -> str:
+    """Remove a leading ```/```html/```json fence and a trailing ``` fence."""
+    # Work out the fence offsets and slice once; strip()/full slices return the
+    # same object when there is nothing to remove, so unfenced text is not copied.
+    text = raw.strip()
+    opening = _FENCE_OPEN_RE.match(text)
+    start = opening.end() if opening else 0
+    end = len(text)
+    if end - 3 >= start and text.endswith("```"):
+        end -= 3
+    return text[start:end].strip()
+
+
+def extract_html(raw: str) -> str:
+    """Strip fences / leading prose and return the first complete HTML document."""
+    text = strip_fences(raw)
+
+    # Common case: {"email_html": "..."} – decode just that string value with
+    # the C string scanner instead of materialising the whole object.
+    wrapper = _EMAIL_HTML_PREFIX_RE.match(text)
+    if wrapper:
+        try:
+            text = scanstring(text, wrapper.end())[0]
+        except ValueError:
+            pass  # truncated/invalid string – fall through to the slow path
+
+    # If the model wrapped the HTML in some other JSON object, unwrap it.
+    if text.startswith("{"):
+        try:
+            obj = orjson.loads(text)
+            if isinstance(obj, dict):
+                for val in obj.values():
+                    if isinstance(val, str) and _HTML_MARKER_RE.search(val):
+                        text = val  # the JSON parse already unescapes \\n → \n etc.
+                        break
+        except ValueError:
+            # Strict parse failed (e.g. truncated output) — pull the email_html
+            # string value out with a JSON-string-aware regex instead.
+            html_val_match = _EMAIL_HTML_VALUE_RE.search(text)
+            if html_val_match:
+                raw_val = html_val_match.group(1)
+                if raw_val.endswith('"'):
+                    raw_val = raw_val[:-1]
+                try:
+                    text = orjson.loads('"' + raw_val + '"')
+                except ValueError:
+                    text = _JSON_ESCAPE_RE.sub(lambda e: _JSON_ESCAPES[e.group(1)], raw_val)
+
+    start = _HTML_START_RE.search(text)
+    if start:
+        end = _HTML_END_RE.search(text, start.end())
+        if end:
+            return text[start.start():end.end()]
+    # Last resort: return whatever we have after fence stripping.
+    return text
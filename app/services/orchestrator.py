@@ -4,19 +4,25 @@ app/services/orchestrator.py – multi-phase campaign generation workflow.
 Phases
 ──────
 1. Clarify   – detect missing inputs; return questions or proceed.
-2. Research  – LLM-only knowledge research.
-3. Strategy  – campaign blueprint.
-4. Execution – per-email copy assets.
+2. Research  – LLM-only knowledge research.      } one Gemini call
+3. Strategy  – campaign blueprint.               }
+4. Execution – copy assets for every email (one call).
 5. Production – HTML generation (if requested).
 6. Critique  – LLM + rule-based self-review.
 """
 from __future__ import annotations
 
+import contextvars
+import copy
+import functools
 import logging
-import re
+import string
 import time
-from typing import Any, Optional
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional, TypeVar
 
+from app.config import settings
 from app.models import (
     Blueprint,
     CampaignRequest,
@@ -28,7 +34,9 @@ from app.models import (
     PhaseTimings,
     ResponseMetadata,
 )
+from app.services.cache import model_key, phase_cache
 from app.services.gemini_client import GeminiClient
+from app.services.html_extract import extract_html
 from app.services import prompting
 from app.services.validators import run_email_rules
 
@@ -39,6 +47,55 @@ def _ms(start: float) -> float:
     return round((time.perf_counter() - start) * 1000, 1)
 
 
+# ── Concurrent Gemini calls ──────────────────────────────────────────────────
+# GeminiClient.generate_text blocks on network I/O, so independent calls (and
+# other blocking pipeline I/O such as external research) are fanned out on
+# worker threads. Workers belong to the call that starts them rather than to a
+# process-wide pool, so one request's fan-out never queues behind another's;
+# gemini_max_concurrency caps how many calls a single fan-out has in flight.
+# Sequential phase calls (clarify, research+strategy, execution, the fast
+# path) run on the request's own thread.
+
+_T = TypeVar("_T")
+
+
+def _run_concurrently(calls: list[Callable[[], _T]]) -> list[_T]:
+    """Run independent blocking calls on worker threads; results keep input order.
+
+    At most gemini_max_concurrency calls are in flight at once. Each call runs
+    in a copy of the caller's context so per-request log context (request ID)
+    carries over. The first failure is re-raised after cancelling calls that
+    have not started yet.
+    """
+    if not calls:
+        return []
+    pool = ThreadPoolExecutor(
+        max_workers=min(len(calls), settings.gemini_max_concurrency),
+        thread_name_prefix="gemini",
+    )
+    futures = [pool.submit(contextvars.copy_context().run, call) for call in calls]
+    try:
+        return [f.result() for f in futures]
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _start(fn: Callable[..., _T], /, *args: Any) -> Future[_T]:
+    """Start one blocking call on its own worker thread, in a copy of the
+    caller's context, and return its future."""
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gemini")
+    try:
+        return pool.submit(contextvars.copy_context().run, fn, *args)
+    finally:
+        pool.shutdown(wait=False)
+
+
+def _timed(call: Callable[[], _T]) -> tuple[_T, float]:
+    """Run call() and return its result with the elapsed milliseconds."""
+    start = time.perf_counter()
+    return call(), _ms(start)
+
+
 # ── Minimal responsive HTML email template ───────────────────────────────────
 # Used by the fast path: Gemini fills content fields; Python stitches the HTML.
 
@@ -50,12 +107,12 @@ _HTML_TEMPLATE = """\
   <meta name="viewport" content="width=device-width,initial-scale=1"/>
   <title>{subject}</title>
 </head>
-<body style="margin:0;padding:0;background:#f4f4f5;font-family:Arial,Helvetica,sans-serif">
+<body style="margin:0;padding:0;background:#f4f4f5;font-family:{font_body}">
 <div style="display:none;max-height:0;overflow:hidden;font-size:1px;color:#f4f4f5">{preheader}&nbsp;</div>
 <table role="presentation" width="100%" cellspacing="0" cellpadding="0" border="0" style="background:#f4f4f5">
   <tr><td align="center" style="padding:24px 12px">
     <table role="presentation" width="600" cellspacing="0" cellpadding="0" border="0"
-           style="max-width:600px;width:100%;background:#ffffff;border-radius:8px;overflow:hidden">
+           style="max-width:600px;width:100%;background:#ffffff;border-radius:{border_radius};overflow:hidden">
       <!-- Header -->
       <tr><td style="background:{brand_color};padding:28px 40px;text-align:center">
         <span style="font-size:22px;font-weight:700;color:{header_text_color}">{brand_name}</span>
@@ -75,7 +132,7 @@ _HTML_TEMPLATE = """\
       <!-- CTA -->
       <tr><td style="padding:0 40px 36px;text-align:center">
         <a href="{cta_url}"
-           style="display:inline-block;background:{brand_color};color:#ffffff;text-decoration:none;padding:16px 44px;border-radius:6px;font-size:16px;font-weight:700"
+           style="display:inline-block;background:{brand_color};color:#ffffff;text-decoration:none;padding:16px 44px;border-radius:{border_radius};font-size:16px;font-weight:700"
         >{cta_button}</a>
       </td></tr>
       <!-- Footer -->
@@ -93,29 +150,78 @@ _HTML_TEMPLATE = """\
 </html>"""
 
 
-def _render_email_html(req: CampaignRequest, sections: dict[str, Any]) -> str:
-    """Stitch Gemini content fields into the HTML template."""
+def _compile_template(template: str) -> tuple[tuple[str, ...], tuple[Optional[str], ...]]:
+    """Split a str.format template into literal segments and field names, once."""
+    parsed = list(string.Formatter().parse(template))
+    return tuple(p[0] for p in parsed), tuple(p[1] for p in parsed)
 
-    def _e(s: Any) -> str:
-        """Escape curly braces in user content so .format() doesn't choke."""
-        return str(s or "").replace("{", "&#123;").replace("}", "&#125;")
 
-    dt = req.brand.design_tokens
-    brand_color = (dt.primary_color if dt else "#0066cc").strip()
-    font_body = (dt.font_family_body if dt else "Arial, sans-serif")
-    font_heading = (dt.font_family_heading if dt else "Arial, sans-serif")
-    border_radius = (dt.border_radius if dt else "6px")
+def _render_compiled(
+    compiled: tuple[tuple[str, ...], tuple[Optional[str], ...]],
+    values: dict[str, str],
+) -> str:
+    """Interleave precompiled literal segments with field values (no format parsing)."""
+    literals, fields = compiled
+    parts: list[str] = []
+    for literal, field in zip(literals, fields):
+        parts.append(literal)
+        if field is not None:
+            parts.append(values[field])
+    return "".join(parts)
+
+
+_HTML_COMPILED = _compile_template(_HTML_TEMPLATE)
+
+
+def _e(s: Any) -> str:
+    """Escape curly braces in user content as HTML entities."""
+    # Chained replace beats str.translate here: with no braces present (the
+    # usual case) each call is a memchr scan that returns the string as-is.
+    return str(s or "").replace("{", "&#123;").replace("}", "&#125;")
+
 
-    # Pick white or dark header text based on rough luminance
+@functools.lru_cache(maxsize=256)
+def _header_text_color(brand_color: str) -> str:
+    """Pick white or dark header text based on the brand colour's rough luminance."""
     try:
         r, g, b = int(brand_color[1:3], 16), int(brand_color[3:5], 16), int(brand_color[5:7], 16)
-        luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-        header_text_color = "#ffffff" if luminance < 0.55 else "#111827"
-    except Exception:
-        header_text_color = "#ffffff"
+    except ValueError:
+        return "#ffffff"
+    # Integer form of (0.299r + 0.587g + 0.114b) / 255 < 0.55.
+    return "#ffffff" if 299 * r + 587 * g + 114 * b < 140_250 else "#111827"
+
+
+def _brand_render_context(req: CampaignRequest) -> dict[str, str]:
+    """Template fields that depend only on the request, shared by every email."""
+    dt = req.brand.design_tokens
+    brand_color = dt.primary_color.strip()
+    return {
+        "lang": _e(req.objective.language or "en"),
+        "brand_color": brand_color,
+        "header_text_color": _header_text_color(brand_color),
+        "brand_name": _e(req.brand.brand_name),
+        "heading_font": dt.font_family_heading,
+        "font_body": dt.font_family_body,
+        "border_radius": dt.border_radius,
+        "cta_url": "#",
+    }
+
+
+def _render_email_html(
+    req: CampaignRequest,
+    sections: dict[str, Any],
+    brand: Optional[dict[str, str]] = None,
+) -> str:
+    """Stitch Gemini content fields into the HTML template.
+
+    Pass ``brand`` (from ``_brand_render_context``) when rendering several
+    emails for the same request so the invariant fields are resolved once.
+    """
+    if brand is None:
+        brand = _brand_render_context(req)
 
     bullets: list[str] = sections.get("body_bullets") or []
-    bullets_html = "".join(f"<li>{_e(b)}</li>" for b in bullets)
+    bullets_html = "".join([f"<li>{_e(b)}</li>" for b in bullets])
 
     urgency = _e(sections.get("urgency_line") or "").strip()
     urgency_html = (
@@ -124,32 +230,22 @@ def _render_email_html(req: CampaignRequest, sections: dict[str, Any]) -> str:
         else ""
     )
 
-    cta_url = "#"
-
     subject = sections.get("subject", "")
-    # Inject brand fonts and border-radius into the template
-    html = _HTML_TEMPLATE.format(
-        lang=_e(req.objective.language or "en"),
-        subject=_e(subject),
-        preheader=_e(sections.get("preheader", "")),
-        brand_color=brand_color,
-        header_text_color=header_text_color,
-        brand_name=_e(req.brand.brand_name),
-        headline=_e(sections.get("headline", "")),
-        heading_font=font_heading,
-        intro_paragraph=_e(sections.get("intro_paragraph", "")),
-        offer_line=_e(sections.get("offer_line", "")),
-        bullets_html=bullets_html,
-        urgency_html=urgency_html,
-        cta_url=cta_url,
-        cta_button=_e(sections.get("cta_button", "Shop Now")),
-        footer_line=_e(sections.get("footer_line", "")),
+    return _render_compiled(
+        _HTML_COMPILED,
+        dict(
+            brand,
+            subject=_e(subject),
+            preheader=_e(sections.get("preheader", "")),
+            headline=_e(sections.get("headline", "")),
+            intro_paragraph=_e(sections.get("intro_paragraph", "")),
+            offer_line=_e(sections.get("offer_line", "")),
+            bullets_html=bullets_html,
+            urgency_html=urgency_html,
+            cta_button=_e(sections.get("cta_button", "Shop Now")),
+            footer_line=_e(sections.get("footer_line", "")),
+        ),
     )
-    # Post-process: swap default font stack and border-radius with brand values
-    html = html.replace("font-family:Arial,Helvetica,sans-serif", f"font-family:{font_body}")
-    html = html.replace("border-radius:8px", f"border-radius:{border_radius}")
-    html = html.replace("border-radius:6px", f"border-radius:{border_radius}")
-    return html
 
 
 def _phase_rapid_batch(
@@ -171,40 +267,46 @@ def _phase_rapid_batch(
     parsed = result.get("parsed") or {}
     raw_emails: list[dict] = parsed.get("emails") or []
 
+    # Brand/request-level template fields are identical for every email.
+    brand = _brand_render_context(req) if req.deliverables.include_html else None
+
     assets: list[EmailAsset] = []
     for em in raw_emails:
         secs = em.get("sections") or {}
-        subject = (em.get("subject_lines") or [""])[0]
+        # Read each list field once; only a missing/empty value allocates a [].
+        subject_lines = em.get("subject_lines") or []
+        preview_text_options = em.get("preview_text_options") or []
+        email_number = em.get("email_number", len(assets) + 1)
+        subject = subject_lines[0] if subject_lines else ""
         secs["subject"] = subject  # pass to HTML renderer
-        html = _render_email_html(req, secs) if req.deliverables.include_html else None
+        html = _render_email_html(req, secs, brand) if brand is not None else None
 
         # Validate with existing rule checker
-        body_text = "\n".join(
-            filter(None, [
-                secs.get("headline", ""),
-                secs.get("intro_paragraph", ""),
-                secs.get("offer_line", ""),
-                *[f"• {b}" for b in (secs.get("body_bullets") or [])],
-                secs.get("urgency_line", ""),
-            ])
-        )
+        parts: list[str] = [
+            v for v in (secs.get("headline"), secs.get("intro_paragraph"), secs.get("offer_line")) if v
+        ]
+        parts.extend([f"• {b}" for b in secs.get("body_bullets") or ()])
+        urgency_line = secs.get("urgency_line")
+        if urgency_line:
+            parts.append(urgency_line)
+        body_text = "\n".join(parts)
         rule_result = run_email_rules(
             req=req,
             email={
-                "email_number": em.get("email_number", len(assets) + 1),
+                "email_number": email_number,
                 "body_text": body_text,
-                "subject_lines": em.get("subject_lines") or [],
-                "preview_text_options": em.get("preview_text_options") or [],
+                "subject_lines": subject_lines,
+                "preview_text_options": preview_text_options,
             },
         )
         a11y_notes = rule_result.issues + rule_result.risk_flags
 
         assets.append(
             EmailAsset(
-                email_number=em.get("email_number", len(assets) + 1),
+                email_number=email_number,
                 email_name=em.get("email_name", f"Email {len(assets)+1}"),
-                subject_lines=em.get("subject_lines") or [subject],
-                preview_text_options=em.get("preview_text_options") or [],
+                subject_lines=subject_lines or [subject],
+                preview_text_options=preview_text_options,
                 body_text=body_text,
                 ctas=em.get("ctas") or [],
                 send_timing=em.get("send_timing", ""),
@@ -214,65 +316,6 @@ def _phase_rapid_batch(
         )
 
     return assets
-def _extract_html(raw: str) -> str:
-    """Strip fences/prose and return the first complete HTML document found."""
-    import json as _json
-
-    text = raw.strip()
-    # 1. Strip markdown code fences
-    for fence in ("```html", "```json", "```"):
-        if text.startswith(fence):
-            text = text[len(fence):].lstrip("\n")
-            break
-    if text.endswith("```"):
-        text = text[:-3].rstrip()
-    text = text.strip()
-
-    # 2. If the model wrapped the HTML inside a JSON object (e.g. {"email_html": "..."}),
-    #    parse it and extract the first string value that looks like HTML.
-    if text.startswith("{"):
-        try:
-            obj = _json.loads(text)
-            if isinstance(obj, dict):
-                for val in obj.values():
-                    if isinstance(val, str) and ("<html" in val.lower() or "<!doctype" in val.lower()):
-                        text = val  # already unescaped by json.loads
-                        break
-        except (_json.JSONDecodeError, ValueError):
-            # json.loads failed (e.g. unescaped char inside the HTML string).
-            # Try a JSON-string-aware regex to extract the email_html value directly.
-            html_val_match = re.search(
-                r'"email_html"\s*:\s*"((?:[^"\\]|\\.)*)',
-                text,
-                re.DOTALL,
-            )
-            if html_val_match:
-                raw_val = html_val_match.group(1)
-                # Strip trailing " that closed the string (regex is non-greedy, may include it)
-                if raw_val.endswith('"'):
-                    raw_val = raw_val[:-1]
-                try:
-                    text = _json.loads('"' + raw_val + '"')
-                except _json.JSONDecodeError:
-                    text = (
-                        raw_val
-                        .replace('\\"', '"')
-                        .replace('\\n', '\n')
-                        .replace('\\r', '\r')
-                        .replace('\\t', '\t')
-                        .replace('\\\\', '\\')
-                    )
-
-    # 3. Try DOCTYPE-anchored match
-    m = re.search(r"(<!DOCTYPE\s+html[\s\S]*?</html>)", text, re.IGNORECASE)
-    if m:
-        return m.group(1)
-    # 4. Try plain <html>...</html>
-    m2 = re.search(r"(<html[\s\S]*?</html>)", text, re.IGNORECASE)
-    if m2:
-        return m2.group(1)
-    # 5. Last resort: return whatever we have after fence stripping
-    return text
 
 
 # ── External Research Stub Interface ─────────────────────────────────────────-
@@ -307,6 +350,33 @@ class NoOpExternalResearch(ExternalResearchProvider):
         return ""
 
 
+# ── Phase response cache ──────────────────────────────────────────────────────
+# Clarify and research+strategy run at low temperature and depend only on the
+# request, so a re-run of the same brief reuses their parsed output. Execution
+# and production are deliberately not cached: they are the creative phases.
+
+
+def _generate_cached(
+    phase: str,
+    req: CampaignRequest,
+    client: GeminiClient,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    """Return the parsed JSON of ``client.generate_text(**kwargs)``, cached per request.
+
+    Callers receive a deep copy, so mutating the result never touches the cache.
+    """
+    key = (phase, str(client._model), model_key(req))
+    parsed = phase_cache.get(key)
+    if parsed is None:
+        parsed = client.generate_text(**kwargs).get("parsed") or {}
+        if parsed:  # never pin an empty/failed parse
+            phase_cache.set(key, parsed)
+    else:
+        logger.debug("Phase cache hit: %s", phase)
+    return copy.deepcopy(parsed)
+
+
 # ── Phase implementations ──────────────────────────────────────────────────────
 
 
@@ -319,14 +389,15 @@ def _phase_clarify(
 
     Returns (needs_clarification: bool, questions: list[ClarificationQuestion]).
     """
-    prompt = prompting.build_clarify_prompt(req)
-    result = client.generate_text(
-        prompt=prompt,
+    parsed = _generate_cached(
+        "clarify",
+        req,
+        client,
+        prompt=prompting.build_clarify_prompt(req),
         system_instruction=prompting.SHARED_SYSTEM_INSTRUCTION,
         json_schema=prompting.CLARIFY_SCHEMA,
         temperature=0.1,  # deterministic for clarification
     )
-    parsed = result.get("parsed") or {}
 
     needs = bool(parsed.get("needs_clarification", False))
     raw_questions = parsed.get("questions", [])
@@ -342,68 +413,44 @@ def _phase_clarify(
     return needs, questions
 
 
-def _phase_research(
+def _phase_research_strategy(
     req: CampaignRequest,
     client: GeminiClient,
     external: Optional[ExternalResearchProvider] = None,
-) -> dict[str, Any]:
+) -> tuple[Blueprint, dict[str, Any]]:
     """
-    Phase 2 – Research.
+    Phases 2+3 – Research and Strategy in one Gemini call.
 
-    Combines LLM knowledge research with optional external research stub.
+    The blueprint only builds on the research, so a single composite response
+    replaces two dependent round trips. The research section only grounds the
+    blueprint and is not returned.
+    Returns (Blueprint Pydantic model, raw blueprint dict).
     """
-    if external is None:
-        external = NoOpExternalResearch()
-
-    # External research stub (no-op by default)
-    external_results = external.search(
-        f"{req.brand.brand_name} {req.objective.offer} marketing trends"
-    )
-    if external_results:
-        logger.info("External research returned %d results", len(external_results))
+    # External research (no-op by default). A real provider is network I/O
+    # independent of the LLM prompt, so it runs alongside the Gemini call.
+    external_future = None
+    if external is not None and not isinstance(external, NoOpExternalResearch):
+        external_future = _start(
+            external.search,
+            f"{req.brand.brand_name} {req.objective.offer} marketing trends",
+        )
 
-    # LLM knowledge research
-    prompt = prompting.build_research_prompt(req)
-    result = client.generate_text(
-        prompt=prompt,
+    parsed = _generate_cached(
+        "research_strategy",
+        req,
+        client,
+        prompt=prompting.build_research_strategy_prompt(req),
         system_instruction=prompting.SHARED_SYSTEM_INSTRUCTION,
-        json_schema=prompting.RESEARCH_SCHEMA,
-        temperature=0.3,
+        json_schema=prompting.RESEARCH_STRATEGY_SCHEMA,
+        temperature=0.4,
     )
-    research_data: dict[str, Any] = result.get("parsed") or {
-        "audience_insights": [],
-        "channel_insights": [],
-        "seasonal_context": "",
-        "competitive_considerations": [],
-        "assumptions": [],
-    }
 
-    # Merge external results into research (stubbed – just log for now)
+    # External results are not merged into the prompt yet (stubbed – just log).
+    external_results = external_future.result() if external_future is not None else []
     if external_results:
-        research_data["external_results_count"] = len(external_results)
-
-    return research_data
-
-
-def _phase_strategy(
-    req: CampaignRequest,
-    research: dict[str, Any],
-    client: GeminiClient,
-) -> tuple[Blueprint, dict[str, Any]]:
-    """
-    Phase 3 – Strategy.
-
-    Returns (Blueprint Pydantic model, raw blueprint dict).
-    """
-    prompt = prompting.build_strategy_prompt(req, research)
-    result = client.generate_text(
-        prompt=prompt,
-        system_instruction=prompting.SHARED_SYSTEM_INSTRUCTION,
-        json_schema=prompting.STRATEGY_SCHEMA,
-        temperature=0.5,
-    )
-    raw: dict[str, Any] = result.get("parsed") or {}
+        logger.info("External research returned %d results", len(external_results))
 
+    raw: dict[str, Any] = parsed.get("blueprint") or {}
     blueprint = Blueprint(
         campaign_angle=raw.get("campaign_angle", ""),
         core_narrative=raw.get("core_narrative", ""),
@@ -425,7 +472,7 @@ def _phase_execution(
     """
     Phase 4 – Execution.
 
-    Generates copy for each email sequentially.
+    Generates copy for all emails in one structured call.
     Returns (list of EmailAsset models, list of raw dicts).
     """
     num_emails = req.deliverables.number_of_emails
@@ -434,20 +481,45 @@ def _phase_execution(
     # Pad/trim arc beats to match number of emails
     beats = (narrative_arc + [f"Email {i+1}" for i in range(num_emails)])[:num_emails]
 
-    assets: list[EmailAsset] = []
-    raw_emails: list[dict[str, Any]] = []
-
-    for idx in range(num_emails):
-        beat = beats[idx] if beats else f"Email {idx + 1}"
-        prompt = prompting.build_execution_prompt(req, blueprint_raw, idx, beat)
+    # The N emails share the whole brief and blueprint, so one call returning
+    # an array replaces N calls that each re-send the same context (and lets
+    # the model keep the sequence coherent).
+    def _generate(first: int, count: int) -> list[dict[str, Any]]:
         result = client.generate_text(
-            prompt=prompt,
+            prompt=prompting.build_execution_prompt(
+                req, blueprint_raw, beats[first - 1:first - 1 + count], first
+            ),
             system_instruction=prompting.SHARED_SYSTEM_INSTRUCTION,
-            json_schema=prompting.EXECUTION_SCHEMA["properties"]["emails"]["items"],
+            json_schema=prompting.execution_schema(count),
             temperature=0.7,  # More creative for copy
+            max_output_tokens=32768,
         )
-        raw_email: dict[str, Any] = result.get("parsed") or {}
+        parsed: dict[str, Any] = result.get("parsed") or {}
+        return [e for e in parsed.get("emails") or [] if isinstance(e, dict)][:count]
+
+    emails = _generate(1, num_emails)
+
+    # The schema pins the array length, but a short response is still possible;
+    # generate each missing email on its own rather than return a short campaign.
+    returned = len(emails)
+    if returned < num_emails:
+        logger.warning(
+            "Phase 4 returned %d/%d emails; generating the rest individually",
+            returned,
+            num_emails,
+        )
+        missing = range(returned + 1, num_emails + 1)
+        for n, extra in zip(
+            missing, _run_concurrently([functools.partial(_generate, n, 1) for n in missing])
+        ):
+            if not extra:
+                raise RuntimeError(f"Phase 4 could not generate email {n}/{num_emails}")
+            emails.append(extra[0])
 
+    assets: list[EmailAsset] = []
+    raw_emails: list[dict[str, Any]] = []
+
+    for idx, raw_email in enumerate(emails):
         # Ensure email_number is correct
         raw_email["email_number"] = idx + 1
         raw_emails.append(raw_email)
@@ -478,39 +550,45 @@ def _phase_production(
     """
     Phase 5 – HTML Production.
 
-    Generates responsive HTML for each email asset.
+    Generates responsive HTML for all email assets concurrently.
     """
-    updated_assets: list[EmailAsset] = []
-    for asset, raw_email in zip(assets, raw_emails):
+    def _generate(raw_email: dict[str, Any]) -> Callable[[], dict[str, Any]]:
         prompt = prompting.build_production_prompt(req, raw_email)
-        result = client.generate_text(
+        return lambda: client.generate_text(
             prompt=prompt,
             system_instruction=prompting.SHARED_SYSTEM_INSTRUCTION,
             json_schema=prompting.HTML_OUTPUT_SCHEMA,
             temperature=0.2,
             max_output_tokens=32768,
         )
-        raw_text = result.get("text", "")
-        html_text = (result.get("parsed") or {}).get("email_html") or _extract_html(raw_text)
-        logger.info(
-            "[HTML step 1/3] Gemini raw response for email %d — length=%d, "
-            "has_real_newlines=%s, has_literal_backslash_n=%s, first 300 chars: %s",
-            asset.email_number,
-            len(raw_text),
-            repr("\n" in raw_text),
-            repr("\\n" in raw_text),
-            repr(raw_text[:300]),
-        )
 
-        html_text = (result.get("parsed") or {}).get("email_html") or _extract_html(raw_text)
-        logger.info(
-            "[HTML step 2/3] Resolved html for email %d — length=%d, "
-            "source=%s, first 120 chars: %s",
-            asset.email_number,
-            len(html_text),
-            "parsed" if (result.get("parsed") or {}).get("email_html") else "fallback_extract",
-            repr(html_text[:120]),
-        )
+    # HTML for each email depends only on that email's copy: fan out all calls,
+    # then post-process the responses in order.
+    results = _run_concurrently([_generate(raw_email) for raw_email in raw_emails])
+
+    updated_assets: list[EmailAsset] = []
+    for asset, result in zip(assets, results):
+        raw_text = result.get("text", "")
+        parsed_html = (result.get("parsed") or {}).get("email_html")
+        html_text = parsed_html or extract_html(raw_text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[HTML step 1/3] Gemini raw response for email %d — length=%d, "
+                "has_real_newlines=%s, has_literal_backslash_n=%s, first 300 chars: %s",
+                asset.email_number,
+                len(raw_text),
+                "\n" in raw_text,
+                "\\n" in raw_text,
+                repr(raw_text[:300]),
+            )
+            logger.debug(
+                "[HTML step 2/3] Resolved html for email %d — length=%d, "
+                "source=%s, first 120 chars: %s",
+                asset.email_number,
+                len(html_text),
+                "parsed" if parsed_html else "fallback_extract",
+                repr(html_text[:120]),
+            )
 
         if not html_text:
             logger.warning("Phase 5 returned empty HTML for email %d", asset.email_number)
@@ -631,31 +709,37 @@ def orchestrate_campaign(
             ),
         )
 
-    # ── Phase 2: Research ─────────────────────────────────────────────────────
-    t = time.perf_counter()
-    research = _phase_research(req, client, external_research)
-    timings.research_ms = _ms(t)
-
-    # ── Phase 3: Strategy ──────────────────────────────────────────────────────
+    # ── Phases 2+3: Research & Strategy (one call) ────────────────────────────
     t = time.perf_counter()
-    blueprint, blueprint_raw = _phase_strategy(req, research, client)
-    timings.strategy_ms = _ms(t)
+    blueprint, blueprint_raw = _phase_research_strategy(req, client, external_research)
+    timings.research_ms = _ms(t)  # research + strategy combined
+    timings.strategy_ms = None  # merged into research_ms
 
     # ── Phase 4: Execution ─────────────────────────────────────────────────────
     t = time.perf_counter()
     assets, raw_emails = _phase_execution(req, blueprint_raw, client)
     timings.execution_ms = _ms(t)
 
+    # ── Phase 6: Critique ──────────────────────────────────────────────────────
+    # Critique reads the pre-HTML email dicts, not the rendered HTML, so it is
+    # started first and runs alongside Phase 5. Its arguments are bound here,
+    # before Phase 5 rebinds `assets`.
+    critique_future = _start(
+        _timed,
+        functools.partial(_phase_critique, req, blueprint_raw, assets, raw_emails, client),
+    )
+
     # ── Phase 5: HTML Production ──────────────────────────────────────────────
     if req.deliverables.include_html:
         t = time.perf_counter()
-        assets = _phase_production(req, assets, raw_emails, client)
+        try:
+            assets = _phase_production(req, assets, raw_emails, client)
+        except BaseException:
+            critique_future.cancel()
+            raise
         timings.production_ms = _ms(t)
 
-    # ── Phase 6: Critique ──────────────────────────────────────────────────────
-    t = time.perf_counter()
-    critique = _phase_critique(req, blueprint_raw, assets, raw_emails, client)
-    timings.critique_ms = _ms(t)
+    critique, timings.critique_ms = critique_future.result()
 
     timings.total_ms = _ms(total_start)
 
@@ -697,7 +781,7 @@ def orchestrate_campaign_fast(
       Phase 0 – parsing (done in route, before this function)
       Phase 1 – skipped (caller sets skip_clarify=True after parse)
       Phase R – rapid batch: research + strategy + execution + HTML in one call
-    Total Gemini calls: 1 (vs 5+2N in the full pipeline for N emails).
+    Total Gemini calls: 1 (vs 4+N in the full pipeline for N emails).
     """
     timings = PhaseTimings()
     total_start = time.perf_counter()
@@ -7,9 +7,13 @@ Design principles
 • All prompts embed the JSON schema directly so the model understands the shape.
 • System instructions emphasize: no hallucination, label assumptions, brand safety.
 • Templates use simple string formatting (no heavy templating engine dependency).
+• Per-call variation (the email content) goes at the END of prompts that are
+  sent several times per campaign, so the shared leading text stays
+  byte-identical and Gemini's implicit prefix cache can reuse it.
 """
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from app.models import CampaignRequest
@@ -123,38 +127,6 @@ RESEARCH_SCHEMA: dict = {
 }
 
 
-def build_research_prompt(req: CampaignRequest) -> str:
-    return f"""\
-You are conducting knowledge-based research (no external browsing) for the following \
-marketing campaign. Use your training knowledge to synthesise relevant insights.
-
-CAMPAIGN BRIEF:
-- Brand: {req.brand.brand_name}
-- Offer: {req.objective.offer}
-- Audience: {req.objective.target_audience}
-- Geo: {req.objective.geo_scope}
-- Language: {req.objective.language}
-- Channels: {[c.value for c in req.channels]}
-- Primary KPI: {req.objective.primary_kpi.value}
-
-Research tasks:
-1. Provide 3–5 audience behaviour insights relevant to this campaign.
-2. Provide 3–5 email/channel best-practice insights relevant to the geo and offer type.
-3. Summarise relevant seasonal or contextual factors.
-4. Note 2–3 competitive considerations (general, not specific competitor claims).
-5. Label all assumptions clearly.
-
-Return ONLY valid JSON matching this structure:
-{{
-  "audience_insights": ["..."],
-  "channel_insights": ["..."],
-  "seasonal_context": "...",
-  "competitive_considerations": ["..."],
-  "assumptions": ["ASSUMPTION: ..."]
-}}
-"""
-
-
 # ── Phase 3 – Strategy ────────────────────────────────────────────────────────
 
 STRATEGY_SCHEMA: dict = {
@@ -192,10 +164,24 @@ STRATEGY_SCHEMA: dict = {
 }
 
 
-def build_strategy_prompt(req: CampaignRequest, research: dict[str, Any]) -> str:
+# ── Phases 2+3 – Research & Strategy (one call) ──────────────────────────────
+# The blueprint only builds on the research, so both are produced in a single
+# response instead of two dependent round trips.
+
+RESEARCH_STRATEGY_SCHEMA: dict = {
+    "type": "object",
+    "required": ["research", "blueprint"],
+    "properties": {
+        "research": RESEARCH_SCHEMA,
+        "blueprint": STRATEGY_SCHEMA,
+    },
+}
+
+
+def build_research_strategy_prompt(req: CampaignRequest) -> str:
     return f"""\
-Create a comprehensive campaign strategy (blueprint) for the following brief. \
-Ground your strategy in the research insights provided.
+Research the following marketing campaign using your training knowledge (no external \
+browsing), then create a comprehensive campaign strategy (blueprint) grounded in that research.
 
 CAMPAIGN BRIEF:
 - Campaign Name: {req.campaign_name}
@@ -214,10 +200,14 @@ CAMPAIGN BRIEF:
 - Banned Phrases: {req.brand.banned_phrases}
 - Required Phrases: {req.brand.required_phrases}
 
-RESEARCH INSIGHTS:
-{_format_research(research)}
+Research tasks ("research"):
+1. Provide 3–5 audience behaviour insights relevant to this campaign.
+2. Provide 3–5 email/channel best-practice insights relevant to the geo and offer type.
+3. Summarise relevant seasonal or contextual factors.
+4. Note 2–3 competitive considerations (general, not specific competitor claims).
+5. Label all assumptions clearly.
 
-Strategy tasks:
+Strategy tasks ("blueprint") – build on the research above:
 1. Define the single, compelling campaign angle (1–2 sentences).
 2. Write the core narrative arc that unifies all {req.deliverables.number_of_emails} \
 emails.
@@ -230,14 +220,23 @@ emails.
 
 Return ONLY valid JSON:
 {{
-  "campaign_angle": "...",
-  "core_narrative": "...",
-  "offer_logic": "...",
-  "narrative_arc": ["Beat 1: ...", "Beat 2: ...", ...],
-  "kpi_mapping": {{"revenue": "...", "open_rate": "..."}},
-  "channel_strategy": {{"email": "..."}},
-  "risks": ["Risk: ... | Mitigation: ..."],
-  "assumptions": ["ASSUMPTION: ..."]
+  "research": {{
+    "audience_insights": ["..."],
+    "channel_insights": ["..."],
+    "seasonal_context": "...",
+    "competitive_considerations": ["..."],
+    "assumptions": ["ASSUMPTION: ..."]
+  }},
+  "blueprint": {{
+    "campaign_angle": "...",
+    "core_narrative": "...",
+    "offer_logic": "...",
+    "narrative_arc": ["Beat 1: ...", "Beat 2: ...", ...],
+    "kpi_mapping": {{"revenue": "...", "open_rate": "..."}},
+    "channel_strategy": {{"email": "..."}},
+    "risks": ["Risk: ... | Mitigation: ..."],
+    "assumptions": ["ASSUMPTION: ..."]
+  }}
 }}
 """
 
@@ -288,17 +287,35 @@ EXECUTION_SCHEMA: dict = {
 }
 
 
+@functools.cache
+def execution_schema(num_emails: int) -> dict:
+    """EXECUTION_SCHEMA with the emails array pinned to exactly ``num_emails`` items.
+
+    Cached so each count maps to one schema object; GeminiClient keys its
+    request configs by schema identity.
+    """
+    emails = {
+        **EXECUTION_SCHEMA["properties"]["emails"],
+        "minItems": num_emails,
+        "maxItems": num_emails,
+    }
+    return {**EXECUTION_SCHEMA, "properties": {"emails": emails}}
+
+
 def build_execution_prompt(
     req: CampaignRequest,
     blueprint: dict[str, Any],
-    email_index: int,
-    narrative_beat: str,
+    beats: list[str],
+    first_number: int = 1,
 ) -> str:
-    email_num = email_index + 1
-    total = req.deliverables.number_of_emails
+    total = len(beats)
+    beat_lines = "\n".join(
+        f"- Email {i}: {beat}" for i, beat in enumerate(beats, first_number)
+    )
 
     return f"""\
-Write email #{email_num} of {total} for the following campaign.
+Write the {total} email(s) listed under NARRATIVE BEATS for the following \
+{req.deliverables.number_of_emails}-email campaign, in send order.
 
 CAMPAIGN CONTEXT:
 - Campaign: {req.campaign_name}
@@ -317,9 +334,10 @@ CAMPAIGN STRATEGY:
 - Angle: {blueprint.get('campaign_angle', '')}
 - Core Narrative: {blueprint.get('core_narrative', '')}
 
-THIS EMAIL'S NARRATIVE BEAT: {narrative_beat}
+NARRATIVE BEATS (one email per beat):
+{beat_lines}
 
-COPY REQUIREMENTS:
+COPY REQUIREMENTS (for every email):
 - Write 3+ distinct subject lines (A/B testable). Keep under 50 characters where possible.
 - Write 2 preview text options (under 90 characters each).
 - Write the full email body. Use brand voice. Include the legal footer at the end.
@@ -328,16 +346,21 @@ COPY REQUIREMENTS:
 Give a reason.
 - Do NOT use any banned phrases: {req.brand.banned_phrases}
 - Naturally include required phrases where appropriate: {req.brand.required_phrases}
+- Each email must advance its own beat; do not repeat subject lines or CTAs across emails.
 
-Return ONLY valid JSON:
+Return ONLY valid JSON with exactly {total} emails:
 {{
-  "email_number": {email_num},
-  "email_name": "...",
-  "subject_lines": ["...", "...", "..."],
-  "preview_text_options": ["...", "..."],
-  "body_text": "... (full email body with legal footer at end) ...",
-  "ctas": ["...", "..."],
-  "send_timing": "..."
+  "emails": [
+    {{
+      "email_number": {first_number},
+      "email_name": "...",
+      "subject_lines": ["...", "...", "..."],
+      "preview_text_options": ["...", "..."],
+      "body_text": "... (full email body with legal footer at end) ...",
+      "ctas": ["...", "..."],
+      "send_timing": "..."
+    }}
+  ]
 }}
 """
 
@@ -471,21 +494,6 @@ email that looks like it was crafted by a world-class design team (think: Stripe
 or a top direct-to-consumer brand). It must render correctly in Gmail, Apple Mail, and \
 Outlook 2016+.
 
-═══════════════════════════════════════════════
-CONTENT TO ENCODE
-═══════════════════════════════════════════════
-Brand name:    {req.brand.brand_name}
-Campaign:      {email_asset.get('email_name', '')}
-{logo_line}
-
-Subject line:  {subject}
-Preview text:  {preview}
-Body copy:
-{body}
-
-CTA button label: {cta}
-Legal footer text: {footer}
-
 ═══════════════════════════════════════════════
 COLOUR PALETTE — pick ONE primary hue, then derive everything from it:
 ═══════════════════════════════════════════════
@@ -501,6 +509,21 @@ STRUCTURE & CODE PATTERNS
 ═══════════════════════════════════════════════
 {_EMAIL_SKELETON_GUIDE}
 
+═══════════════════════════════════════════════
+CONTENT TO ENCODE
+═══════════════════════════════════════════════
+Brand name:    {req.brand.brand_name}
+Campaign:      {email_asset.get('email_name', '')}
+{logo_line}
+
+Subject line:  {subject}
+Preview text:  {preview}
+Body copy:
+{body}
+
+CTA button label: {cta}
+Legal footer text: {footer}
+
 Return a JSON object with a single key "email_html" whose value is the complete HTML string.
 Start the HTML with <!DOCTYPE html> and end with </html>.
 """
@@ -529,18 +552,6 @@ Spacing unit (base padding):              {dt.spacing_unit}
 Border radius (buttons, cards):           {dt.border_radius}
 {logo_line}
 
-═══════════════════════════════════════════════
-CONTENT TO ENCODE
-═══════════════════════════════════════════════
-Brand name:    {req.brand.brand_name}
-Subject line:  {subject}
-Preview text:  {preview}
-Body copy:
-{body}
-
-CTA button label: {cta}
-Legal footer text: {footer}
-
 ═══════════════════════════════════════════════
 STRUCTURE & CODE PATTERNS
 ═══════════════════════════════════════════════
@@ -555,6 +566,18 @@ Apply the brand tokens and derive the full palette:
 - Inner card border-radius: 16px (header top corners, footer bottom corners)
 - Section padding based on spacing unit {dt.spacing_unit} (use multiples as needed)
 
+═══════════════════════════════════════════════
+CONTENT TO ENCODE
+═══════════════════════════════════════════════
+Brand name:    {req.brand.brand_name}
+Subject line:  {subject}
+Preview text:  {preview}
+Body copy:
+{body}
+
+CTA button label: {cta}
+Legal footer text: {footer}
+
 Return a JSON object with a single key "email_html" whose value is the complete HTML string.
 Start the HTML with <!DOCTYPE html> and end with </html>.
 """
@@ -643,18 +666,6 @@ Return ONLY valid JSON:
 # ── Utilities ─────────────────────────────────────────────────────────────────
 
 
-def _format_research(research: dict[str, Any]) -> str:
-    lines: list[str] = []
-    for key, val in research.items():
-        if isinstance(val, list):
-            lines.append(f"{key}:")
-            for item in val:
-                lines.append(f"  - {item}")
-        else:
-            lines.append(f"{key}: {val}")
-    return "\n".join(lines)
-
-
 def _format_email_bodies(emails: list[dict[str, Any]]) -> str:
     parts: list[str] = []
     for e in emails:
@@ -835,6 +846,34 @@ RAPID_BATCH_SCHEMA: dict = {
 }
 
 
+# Request-independent part of the rapid-batch prompt. It goes first so every
+# call shares a byte-identical prefix (after the system instruction), which is
+# what Gemini's implicit prompt caching keys on; the per-request brief follows.
+_RAPID_BATCH_PREAMBLE = """\
+You are a senior email marketing strategist and award-winning copywriter.
+
+OUTPUT FORMAT
+=============
+For each email return ALL of the following fields:
+- email_number     integer, starting at 1
+- email_name       descriptive label, e.g. "Teaser – Day 1"
+- subject_lines    2 A/B variants, 40–60 chars each (emoji allowed if brand-appropriate)
+- preview_text_options  2 variants, 80–100 chars each, complementing the subject
+- ctas             1–2 action phrases for the CTA button(s)
+- send_timing      recommended send day/time with a 1-line rationale
+- sections         object with EXACTLY these 8 keys:
+    headline          compelling H1, max 10 words, no trailing full stop
+    preheader         80–90 chars supplementing the subject line
+    intro_paragraph   2–3 sentence hook addressing the reader's specific pain or aspiration as a member of the target audience
+    offer_line        the specific offer stated concisely for this brand — no generic filler
+    body_bullets      2–4 benefit bullets, each max 12 words, start with a verb
+    cta_button        button label, max 5 words, action-oriented
+    urgency_line      1-sentence deadline/scarcity (use empty string "" if not applicable)
+    footer_line       brand sign-off — friendly 1-sentence closing (must incorporate the legal footer if the brief gives one)
+
+"""
+
+
 def build_rapid_batch_prompt(req: CampaignRequest) -> str:
     """
     Single-call prompt that replaces phases 2-6.
@@ -847,23 +886,23 @@ def build_rapid_batch_prompt(req: CampaignRequest) -> str:
 
     banned = ", ".join(brand.banned_phrases or []) or "none"
     required = ", ".join(brand.required_phrases or []) or "none"
-    channels = ", ".join(ch.value if hasattr(ch, "value") else str(ch) for ch in req.channels) or "email"
+    channels = ", ".join([ch.value for ch in req.channels]) or "email"
     kpis = ", ".join(
         [obj.primary_kpi.value] + [k.value for k in (obj.secondary_kpis or [])]
     )
     n_emails = del_req.number_of_emails
     voice = brand.voice_guidelines or "professional, warm, conversational"
-    brand_color = brand.design_tokens.primary_color if brand.design_tokens else "#0066cc"
-    font_heading = brand.design_tokens.font_family_heading if brand.design_tokens else "Arial, sans-serif"
-    font_body = brand.design_tokens.font_family_body if brand.design_tokens else "Arial, sans-serif"
-    border_radius = brand.design_tokens.border_radius if brand.design_tokens else "6px"
-    logo_url = brand.design_tokens.logo_url if brand.design_tokens else None
+    # design_tokens is a required model field (default_factory), never None.
+    dt = brand.design_tokens
+    brand_color = dt.primary_color
+    font_heading = dt.font_family_heading
+    font_body = dt.font_family_body
+    border_radius = dt.border_radius
+    logo_url = dt.logo_url
     legal_footer = brand.legal_footer or ""
     _footer_rule = ("\n- The footer_line must include the legal text: " + legal_footer) if legal_footer else ""
 
-    return f"""\
-You are a senior email marketing strategist and award-winning copywriter.
-
+    return _RAPID_BATCH_PREAMBLE + f"""\
 CAMPAIGN BRIEF
 ==============
 Brand:            {brand.brand_name}
@@ -897,23 +936,6 @@ PERSONALISATION RULES
 - The intro_paragraph must address the specific audience "{obj.target_audience}" directly.
 - Make the offer_line specific to this brand and offer — avoid generic copy like "exclusive opportunity".{_footer_rule}
 
-For each email return ALL of the following fields:
-- email_number     integer, starting at 1
-- email_name       descriptive label, e.g. "Teaser – Day 1"
-- subject_lines    2 A/B variants, 40–60 chars each (emoji allowed if brand-appropriate)
-- preview_text_options  2 variants, 80–100 chars each, complementing the subject
-- ctas             1–2 action phrases for the CTA button(s)
-- send_timing      recommended send day/time with a 1-line rationale
-- sections         object with EXACTLY these 8 keys:
-    headline          compelling H1, max 10 words, no trailing full stop
-    preheader         80–90 chars supplementing the subject line
-    intro_paragraph   2–3 sentence hook addressing the reader's specific pain or aspiration as {obj.target_audience}
-    offer_line        the specific offer stated concisely for {brand.brand_name} — no generic filler
-    body_bullets      2–4 benefit bullets, each max 12 words, start with a verb
-    cta_button        button label, max 5 words, action-oriented
-    urgency_line      1-sentence deadline/scarcity (use empty string "" if not applicable)
-    footer_line       brand sign-off{f" incorporating: {legal_footer}" if legal_footer else " — friendly 1-sentence closing"}
-
 LANGUAGE RULES
 ==============
 - Write ALL copy in: {obj.language or "en"}
@@ -102,6 +102,15 @@ SPAM_TRIGGER_WORDS: frozenset[str] = frozenset(
 
 _EXCESS_EXCLAMATION_THRESHOLD = 3
 
+# Compiled once at import; the rule checks run for every email of every campaign.
+_ALL_CAPS_RE = re.compile(r"\b[A-Z]{4,}\b")
+_PERCENT_SIGN_RE = re.compile(r"(\d+(?:\.\d+)?)\s*%")
+_PERCENT_WORD_RE = re.compile(r"(\d+)\s*percent", re.IGNORECASE)
+# Known legitimate acronyms that are not ALL CAPS shouting.
+_LEGITIMATE_ACRONYMS = frozenset(
+    {"HTML", "URL", "FAQ", "CEO", "CTA", "KPI", "ROI", "SMS", "USA", "UK"}
+)
+
 
 # ── Dataclass for rule results ─────────────────────────────────────────────────
 
@@ -184,10 +193,8 @@ def check_exclamation_marks(text: str, context: str) -> RuleCheckResult:
 
 def check_all_caps(text: str, context: str) -> RuleCheckResult:
     """Flag words written in ALL CAPS (spam signal)."""
-    all_caps_words = re.findall(r"\b[A-Z]{4,}\b", text)
-    # Filter out known legitimate acronyms
-    legitimate = {"HTML", "URL", "FAQ", "CEO", "CTA", "KPI", "ROI", "SMS", "USA", "UK"}
-    offenders = [w for w in all_caps_words if w not in legitimate]
+    all_caps_words = _ALL_CAPS_RE.findall(text)
+    offenders = [w for w in all_caps_words if w not in _LEGITIMATE_ACRONYMS]
     if offenders:
         return RuleCheckResult(
             passed=False,
@@ -243,9 +250,13 @@ def check_discount_ceiling(text: str, ceiling: Optional[float], context: str) ->
     if ceiling is None:
         return RuleCheckResult(passed=True)
 
-    # Look for percentage patterns like "30%", "35 percent"
-    pct_matches = re.findall(r"(\d+(?:\.\d+)?)\s*%", text)
-    int_matches = re.findall(r"(\d+)\s*percent", text, re.IGNORECASE)
+    # Look for percentage patterns like "30%", "35 percent". Both patterns start
+    # with \d+, so the regex engine would try every offset; a literal probe
+    # first skips the scan for text that cannot match.
+    pct_matches = _PERCENT_SIGN_RE.findall(text) if "%" in text else []
+    int_matches = (
+        _PERCENT_WORD_RE.findall(text) if "percent" in text.lower() else []
+    )
     all_values = [float(v) for v in pct_matches + int_matches]
 
     violations = [v for v in all_values if v > ceiling]
@@ -277,49 +288,42 @@ def run_email_rules(
     ctx_subj = f"Email {email_num} subject lines"
     ctx_preview = f"Email {email_num} preview text"
 
-    all_issues: list[str] = []
-    all_flags: list[str] = []
-    all_fixes: list[str] = []
-
     body = email.get("body_text", "")
     subjects = email.get("subject_lines", [])
     previews = email.get("preview_text_options", [])
+    banned = req.brand.banned_phrases
 
     # Run checks on body
-    for check_fn in [
-        lambda: check_banned_phrases(body, req.brand.banned_phrases, ctx_body),
-        lambda: check_required_phrases(body, req.brand.required_phrases, ctx_body),
-        lambda: check_legal_footer(body, req.brand.legal_footer, ctx_body),
-        lambda: check_exclamation_marks(body, ctx_body),
-        lambda: check_all_caps(body, ctx_body),
-        lambda: check_spam_trigger_words(body, ctx_body),
-        lambda: check_discount_ceiling(body, req.constraints.discount_ceiling, ctx_body),
-    ]:
-        result = check_fn()
-        all_issues.extend(result.issues)
-        all_flags.extend(result.risk_flags)
-        all_fixes.extend(result.fixes)
+    results = [
+        check_banned_phrases(body, banned, ctx_body),
+        check_required_phrases(body, req.brand.required_phrases, ctx_body),
+        check_legal_footer(body, req.brand.legal_footer, ctx_body),
+        check_exclamation_marks(body, ctx_body),
+        check_all_caps(body, ctx_body),
+        check_spam_trigger_words(body, ctx_body),
+        check_discount_ceiling(body, req.constraints.discount_ceiling, ctx_body),
+    ]
 
     # Run checks on subject lines
     for i, subj in enumerate(subjects):
         ctx = f"{ctx_subj}[{i}]"
-        for check_fn in [
-            lambda s=subj, c=ctx: check_subject_line_length(s, c),
-            lambda s=subj, c=ctx: check_spam_trigger_words(s, c),
-            lambda s=subj, c=ctx: check_banned_phrases(s, req.brand.banned_phrases, c),
-        ]:
-            result = check_fn()
-            all_issues.extend(result.issues)
-            all_flags.extend(result.risk_flags)
-            all_fixes.extend(result.fixes)
+        results.append(check_subject_line_length(subj, ctx))
+        results.append(check_spam_trigger_words(subj, ctx))
+        results.append(check_banned_phrases(subj, banned, ctx))
 
     # Run checks on preview text
     for i, preview in enumerate(previews):
-        ctx = f"{ctx_preview}[{i}]"
-        result = check_preview_text_length(preview, ctx)
-        all_issues.extend(result.issues)
-        all_flags.extend(result.risk_flags)
-        all_fixes.extend(result.fixes)
+        results.append(check_preview_text_length(preview, f"{ctx_preview}[{i}]"))
+
+    # Passing checks carry no messages, so only failures are merged.
+    all_issues: list[str] = []
+    all_flags: list[str] = []
+    all_fixes: list[str] = []
+    for result in results:
+        if not result.passed:
+            all_issues.extend(result.issues)
+            all_flags.extend(result.risk_flags)
+            all_fixes.extend(result.fixes)
 
     passed = not all_issues
     return RuleCheckResult(
@@ -372,7 +376,7 @@ def validate_campaign_request(req: CampaignRequest) -> list[ValidationIssue]:
     # Discount ceiling vs offer
     if req.constraints.discount_ceiling is not None:
         offer_lower = req.objective.offer.lower()
-        pct_matches = re.findall(r"(\d+(?:\.\d+)?)\s*%", offer_lower)
+        pct_matches = _PERCENT_SIGN_RE.findall(offer_lower)
         for pct in pct_matches:
             if float(pct) > req.constraints.discount_ceiling:
                 issues.append(
@@ -5,9 +5,21 @@ Integration tests (marked with @pytest.mark.integration) are skipped by
 default. Pass --integration to opt in:
 
     uv run pytest --integration tests/test_integration.py -v
+
+Shared fixtures: the example Christmas campaign payload and a mock
+GeminiClient that answers every pipeline phase.
 """
+from __future__ import annotations
+
+import copy
+from typing import Any
+from unittest.mock import MagicMock
+
 import pytest
 
+from app.models import CampaignRequest
+from app.services import prompting
+
 
 def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption(
@@ -24,3 +36,200 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
         for item in items:
             if item.get_closest_marker("integration"):
                 item.add_marker(skip)
+
+
+# ── Example payload (Christmas campaign) ──────────────────────────────────────
+
+_CHRISTMAS_PAYLOAD: dict[str, Any] = {
+    "campaign_name": "Christmas Discount 2025",
+    "brand": {
+        "brand_name": "AcmeCorp",
+        "voice_guidelines": (
+            "Warm, festive, and friendly. Avoid buzzwords. "
+            "Use inclusive, celebratory language."
+        ),
+        "banned_phrases": ["world-class", "revolutionary", "synergy"],
+        "required_phrases": ["Shop now", "Limited time offer"],
+        "legal_footer": "© 2025 AcmeCorp Inc. | Unsubscribe | Privacy Policy",
+        "design_tokens": {
+            "primary_color": "#B22222",
+            "secondary_color": "#FFFFFF",
+            "accent_color": "#FFD700",
+            "font_family_heading": "Georgia, serif",
+            "font_family_body": "Arial, sans-serif",
+        },
+    },
+    "objective": {
+        "primary_kpi": "revenue",
+        "secondary_kpis": ["open_rate", "click_through_rate"],
+        "target_audience": "Existing customers who purchased in the last 12 months",
+        "offer": "25% off storewide for Christmas",
+        "geo_scope": "United States",
+        "language": "English",
+    },
+    "constraints": {
+        "discount_ceiling": 25.0,
+        "compliance_notes": "CAN-SPAM compliant. No misleading subject lines.",
+        "send_window": "December 18-24, 2025",
+        "exclude_segments": ["unsubscribed", "bounced"],
+        "required_segments": ["active customers"],
+    },
+    "channels": ["email"],
+    "deliverables": {
+        "number_of_emails": 3,
+        "include_html": True,
+        "include_variants": True,
+    },
+}
+
+
+def _make_mock_gemini_client():
+    """Return a MagicMock GeminiClient that returns canned responses."""
+    mock = MagicMock()
+    mock._model = "gemini-2.5-flash-test"
+
+    # Clarification: no clarification needed
+    clarify_response = {
+        "text": '{"needs_clarification": false, "questions": []}',
+        "parsed": {"needs_clarification": False, "questions": []},
+        "model": "gemini-2.5-flash-test",
+        "tokens_used": 100,
+        "latency_ms": 500.0,
+    }
+
+    # Research response
+    research_response = {
+        "text": "{}",
+        "parsed": {
+            "audience_insights": ["Insight 1", "Insight 2"],
+            "channel_insights": ["Email open rates peak at 10am"],
+            "seasonal_context": "Christmas is a high-spend period.",
+            "competitive_considerations": ["Competitors also run Christmas sales."],
+            "assumptions": ["ASSUMPTION: Audience checks email daily."],
+        },
+        "model": "gemini-2.5-flash-test",
+        "tokens_used": 300,
+        "latency_ms": 800.0,
+    }
+
+    # Strategy response
+    strategy_response = {
+        "text": "{}",
+        "parsed": {
+            "campaign_angle": "Celebrate the season with savings.",
+            "core_narrative": "A 3-email journey from tease to close.",
+            "offer_logic": "25% off drives urgency without devaluing brand.",
+            "narrative_arc": ["Tease", "Announce", "Final Push"],
+            "kpi_mapping": {"revenue": "Direct discount drives purchases."},
+            "channel_strategy": {"email": "3 targeted emails over 7 days."},
+            "risks": ["Risk: Discount fatigue | Mitigation: Keep emails concise."],
+            "assumptions": ["ASSUMPTION: Audience is email-responsive."],
+        },
+        "model": "gemini-2.5-flash-test",
+        "tokens_used": 500,
+        "latency_ms": 1200.0,
+    }
+
+    # Research + strategy come back from one call
+    research_strategy_response = {
+        **strategy_response,
+        "parsed": {
+            "research": research_response["parsed"],
+            "blueprint": strategy_response["parsed"],
+        },
+    }
+
+    # Email execution response
+    email_response = {
+        "text": "{}",
+        "parsed": {
+            "email_number": 1,
+            "email_name": "Christmas Teaser",
+            "subject_lines": [
+                "🎄 Your Christmas gift is here",
+                "25% off – just for you",
+                "The holiday deals start now",
+            ],
+            "preview_text_options": [
+                "Unwrap 25% off everything this Christmas.",
+                "Your exclusive holiday discount awaits.",
+            ],
+            "body_text": (
+                "Dear valued customer,\n\nShop now and save 25%! Limited time offer. "
+                "\n\n© 2025 AcmeCorp Inc. | Unsubscribe | Privacy Policy"
+            ),
+            "ctas": ["Shop Now", "Claim My Deal"],
+            "send_timing": "December 18 at 10:00 AM – highest open rates.",
+        },
+        "model": "gemini-2.5-flash-test",
+        "tokens_used": 600,
+        "latency_ms": 1500.0,
+    }
+
+    # Phase 4 returns every email from one call
+    execution_response = {
+        **email_response,
+        "parsed": {
+            "emails": [
+                {**email_response["parsed"], "email_number": n} for n in range(1, 4)
+            ]
+        },
+    }
+
+    # Production (HTML) response – orchestrator reads result["text"] directly now
+    html_response = {
+        "text": "<!DOCTYPE html><html><body>Test HTML</body></html>",
+        "parsed": None,
+        "model": "gemini-2.5-flash-test",
+        "tokens_used": 1000,
+        "latency_ms": 2000.0,
+    }
+
+    # Critique response
+    critique_response = {
+        "text": "{}",
+        "parsed": {
+            "issues": [],
+            "fixes": [],
+            "risk_flags": [],
+            "llm_commentary": "Campaign looks solid overall.",
+            "score": 88,
+        },
+        "model": "gemini-2.5-flash-test",
+        "tokens_used": 400,
+        "latency_ms": 800.0,
+    }
+
+    # Phases 4-5 fan out concurrently, so answer by schema rather than call order.
+    responses_by_schema = {
+        id(prompting.CLARIFY_SCHEMA): clarify_response,
+        id(prompting.RESEARCH_STRATEGY_SCHEMA): research_strategy_response,
+        id(prompting.execution_schema(3)): execution_response,
+        id(prompting.HTML_OUTPUT_SCHEMA): html_response,
+        id(prompting.CRITIQUE_SCHEMA): critique_response,
+    }
+
+    def _respond(**kwargs: Any) -> dict[str, Any]:
+        response = responses_by_schema[id(kwargs["json_schema"])]
+        return {**response, "parsed": copy.deepcopy(response["parsed"])}
+
+    mock.generate_text.side_effect = _respond
+    return mock
+
+
+@pytest.fixture
+def christmas_payload() -> dict[str, Any]:
+    """The example Christmas campaign request body (a fresh copy per test)."""
+    return copy.deepcopy(_CHRISTMAS_PAYLOAD)
+
+
+@pytest.fixture
+def campaign_req(christmas_payload: dict[str, Any]) -> CampaignRequest:
+    """The example payload validated as a CampaignRequest."""
+    return CampaignRequest.model_validate(christmas_payload)
+
+
+@pytest.fixture
+def mock_gemini_client() -> MagicMock:
+    """A mock GeminiClient with canned responses for every pipeline phase."""
+    return _make_mock_gemini_client()
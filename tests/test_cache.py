@@ -0,0 +1,73 @@
+"""
+tests/test_cache.py – unit tests for the in-memory TTL cache.
+
+Run with:
+    pytest tests/test_cache.py -v
+"""
+from __future__ import annotations
+
+from app.models import PromptRequest
+from app.services.cache import TTLCache, model_key
+
+
+def test_set_then_get():
+    cache = TTLCache(ttl_seconds=60)
+    cache.set({"a": 1, "b": [1, 2]}, "value")
+    # Key order does not matter for dict keys.
+    assert cache.get({"b": [1, 2], "a": 1}) == "value"
+    assert len(cache) == 1
+
+
+def test_expired_entry_is_dropped():
+    cache = TTLCache(ttl_seconds=0)
+    cache.set("k", "value")
+    assert cache.get("k") is None
+    assert len(cache) == 0
+
+
+def test_model_key_is_stable_digest():
+    a = PromptRequest(prompt="20% off for UK shoppers")
+    b = PromptRequest(prompt="20% off for UK shoppers")
+    c = PromptRequest(prompt="30% off for UK shoppers")
+    assert model_key(a) == model_key(b)
+    assert model_key(a) != model_key(c)
+    assert isinstance(model_key(a), int)
+
+    cache = TTLCache(ttl_seconds=60)
+    cache.set(model_key(a), "value")
+    assert cache.get(model_key(b)) == "value"
+
+
+def test_lru_eviction_beyond_max_items():
+    cache = TTLCache(ttl_seconds=60, max_items=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_set_sweeps_expired_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("app.services.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl_seconds=10)
+    cache.set("old", 1)
+    now[0] += 5
+    cache.set("old", 2)  # re-set: must survive the first entry's expiry
+    cache.set("other", 3)
+    now[0] += 6
+    cache.set("new", 4)  # sweeps the stale "old" record, keeps the re-set one
+    assert len(cache) == 3
+    now[0] += 11
+    cache.set("newest", 5)
+    assert len(cache) == 1
+
+
+def test_serialised_bytes_key_matches_model_key():
+    req = PromptRequest(prompt="20% off for UK shoppers")
+    cache = TTLCache(ttl_seconds=60)
+    cache.set(req.__pydantic_serializer__.to_json(req), "value")
+    assert cache.get(model_key(req)) == "value"
@@ -184,3 +184,24 @@ def test_send_502_on_provider_error(client: TestClient, monkeypatch):
 
     assert resp.status_code == 502
     assert "provider error" in resp.json()["detail"].lower()
+
+
+def test_sendgrid_client_reused_across_sends(client: TestClient, monkeypatch):
+    """The SendGridAPIClient is constructed once and reused for later sends."""
+    monkeypatch.setattr("app.services.email_client.settings.sendgrid_api_key", "SG.reuse")
+    monkeypatch.setattr("app.services.email_client.settings.email_from", "no-reply@example.com")
+    monkeypatch.setattr("app.services.email_client.settings.email_reply_to", "")
+
+    mock_sg_class = MagicMock()
+    mock_sg_class.return_value.send.return_value = MagicMock(status_code=202)
+
+    with patch.dict(sys.modules, _make_sg_modules(mock_sg_class)):
+        for _ in range(2):
+            resp = client.post(
+                "/v1/email/send",
+                json={"to": "user@example.com", "subject": "Test", "text": "Hello"},
+            )
+            assert resp.status_code == 200
+
+    mock_sg_class.assert_called_once_with("SG.reuse")
+    assert mock_sg_class.return_value.send.call_count == 2
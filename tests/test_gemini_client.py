@@ -0,0 +1,56 @@
+"""
+tests/test_gemini_client.py – unit tests for the Gemini SDK wrapper (no network).
+"""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.services import gemini_client, prompting
+from app.services.gemini_client import GeminiClient
+
+
+@pytest.fixture
+def gemini(monkeypatch: pytest.MonkeyPatch) -> GeminiClient:
+    monkeypatch.setattr(gemini_client.settings, "gemini_api_key", "test-key")
+    return GeminiClient()
+
+
+def test_config_built_once_per_call_shape(gemini: GeminiClient):
+    args = (prompting.SHARED_SYSTEM_INSTRUCTION, prompting.CRITIQUE_SCHEMA, 0.2, 8192)
+    config = gemini._config_for(*args)
+
+    assert gemini._config_for(*args) is config
+    assert config.response_json_schema is prompting.CRITIQUE_SCHEMA
+    assert config.response_mime_type == "application/json"
+
+
+def test_config_differs_by_schema_and_temperature(gemini: GeminiClient):
+    base = gemini._config_for(None, prompting.CRITIQUE_SCHEMA, 0.2, 8192)
+
+    assert gemini._config_for(None, prompting.CLARIFY_SCHEMA, 0.2, 8192) is not base
+    assert gemini._config_for(None, prompting.CRITIQUE_SCHEMA, 0.7, 8192).temperature == 0.7
+    assert gemini._config_for(None, None, 0.2, 8192).response_mime_type is None
+
+
+def test_singleton_created_once_under_concurrency(monkeypatch: pytest.MonkeyPatch):
+    """Concurrent first calls share one client (and so one connection pool)."""
+    monkeypatch.setattr(gemini_client.settings, "gemini_api_key", "test-key")
+    monkeypatch.setattr(gemini_client, "_client_instance", None)
+    barrier = threading.Barrier(8, timeout=5)
+    seen: list[GeminiClient] = []
+
+    def worker() -> None:
+        barrier.wait()
+        seen.append(gemini_client.get_gemini_client())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(c) for c in seen}) == 1
+    gemini_client.close_gemini_client()
+    assert gemini_client._client_instance is None
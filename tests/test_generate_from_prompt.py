@@ -6,15 +6,20 @@ Covers: successful generation, schedule-optional path, missing required fields (
 """
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.services import prompting
 from app.services.gemini_client import get_gemini_client
-from app.services.cache import campaign_cache
+from app.services.cache import campaign_cache, prompt_cache
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
@@ -22,11 +27,13 @@ from app.services.cache import campaign_cache
 
 @pytest.fixture(autouse=True)
 def _clear_overrides_and_cache():
-    """Reset dependency overrides and cache after every test."""
+    """Reset dependency overrides and caches after every test."""
     campaign_cache.clear()
+    prompt_cache.clear()
     yield
     app.dependency_overrides.clear()
     campaign_cache.clear()
+    prompt_cache.clear()
 
 
 @pytest.fixture
@@ -143,8 +150,9 @@ class TestGenerateFromPrompt:
 
     def test_cache_hit_skips_rapid_batch(self, client: TestClient):
         """
-        The cache is keyed on the parsed CampaignRequest.
-        A repeated prompt should return the same emails without a second rapid-batch Gemini call.
+        The campaign cache is keyed on the parsed CampaignRequest.
+        A different prompt that parses to the same campaign should return the same emails
+        without a second rapid-batch Gemini call.
         We verify this by counting how many times generate_text is called across two requests:
         - First request:  2 calls (parse + rapid_batch)
         - Second request: 1 call  (parse only; rapid_batch result comes from cache)
@@ -169,7 +177,8 @@ class TestGenerateFromPrompt:
             "tokens_used": 0, "latency_ms": 0,
         }
 
-        resp2 = client.post("/v1/campaigns/generate-from-prompt", json=payload)
+        payload2 = {**payload, "prompt": "UK shoppers get 20% off – cache test"}
+        resp2 = client.post("/v1/campaigns/generate-from-prompt", json=payload2)
         assert resp2.status_code == 200
         second_call_count = mock.generate_text.call_count  # expect 1 (parse only)
 
@@ -177,6 +186,83 @@ class TestGenerateFromPrompt:
         assert second_call_count == 1, f"Expected 1 call on cache-hit request, got {second_call_count}"
         assert resp2.json()["emails"][0]["subject"] == resp1.json()["emails"][0]["subject"]
 
+    def test_repeated_prompt_skips_parse(self, client: TestClient):
+        """An identical repeated prompt is served from the prompt cache with no Gemini calls."""
+        mock = _make_mock_client(_PARSED_CAMPAIGN, _RAPID_BATCH_EMAIL)
+        app.dependency_overrides[get_gemini_client] = lambda: mock
+
+        payload = {"prompt": "20% off sale for UK shoppers prompt cache", "force_proceed": True}
+
+        resp1 = client.post("/v1/campaigns/generate-from-prompt", json=payload)
+        assert resp1.status_code == 200
+        mock.generate_text.reset_mock()
+
+        resp2 = client.post("/v1/campaigns/generate-from-prompt", json=payload)
+        assert resp2.status_code == 200
+        assert mock.generate_text.call_count == 0
+        assert resp2.json() == resp1.json()
+
+        # Whitespace / case differences still hit the prompt cache.
+        retyped = {**payload, "prompt": "  20% OFF sale for UK\nshoppers  prompt cache"}
+        resp3 = client.post("/v1/campaigns/generate-from-prompt", json=retyped)
+        assert resp3.status_code == 200
+        assert mock.generate_text.call_count == 0
+
+    async def test_concurrent_identical_prompts_share_one_run(self):
+        """Concurrent identical prompts coalesce onto a single parse + rapid-batch run."""
+        mock = _make_mock_client(_PARSED_CAMPAIGN, _RAPID_BATCH_EMAIL)
+        inner = mock.generate_text.side_effect
+
+        def _slow(**kwargs):
+            time.sleep(0.1)  # keep the first request in flight while the others arrive
+            return inner(**kwargs)
+
+        mock.generate_text.side_effect = _slow
+        app.dependency_overrides[get_gemini_client] = lambda: mock
+
+        payload = {"prompt": "20% off sale for UK shoppers in-flight", "force_proceed": True}
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            responses = await asyncio.gather(
+                *(ac.post("/v1/campaigns/generate-from-prompt", json=payload) for _ in range(3))
+            )
+
+        assert [r.status_code for r in responses] == [200, 200, 200]
+        assert mock.generate_text.call_count == 2  # parse + rapid batch, once
+        assert responses[0].json() == responses[1].json() == responses[2].json()
+
+    async def test_cancelled_leader_does_not_fail_followers(self):
+        """A follower whose leader is cancelled (client disconnect) still gets a result."""
+        release = threading.Event()
+
+        def _respond(**kwargs):
+            release.wait(5)  # hold the leader in the parse phase until it is cancelled
+            is_parse = kwargs["json_schema"] is prompting.PARSE_SCHEMA
+            parsed = _PARSED_CAMPAIGN if is_parse else _RAPID_BATCH_EMAIL
+            return {"text": "", "parsed": parsed, "model": "gemini-mock", "tokens_used": 0, "latency_ms": 0}
+
+        mock = MagicMock()
+        mock._model = "gemini-mock"
+        mock.generate_text.side_effect = _respond
+        app.dependency_overrides[get_gemini_client] = lambda: mock
+
+        payload = {"prompt": "20% off sale for UK shoppers leader cancel", "force_proceed": True}
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            leader = asyncio.create_task(ac.post("/v1/campaigns/generate-from-prompt", json=payload))
+            await asyncio.sleep(0.05)
+            follower = asyncio.create_task(ac.post("/v1/campaigns/generate-from-prompt", json=payload))
+            await asyncio.sleep(0.05)
+            leader.cancel()
+            release.set()
+
+            resp = await follower
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+
+        assert resp.status_code == 200
+        assert resp.json()["status"] != "needs_clarification"
+
     def test_missing_prompt_returns_422(self, client: TestClient):
         """Omitting the required `prompt` field must return 422, not 500/503."""
         resp = client.post("/v1/campaigns/generate-from-prompt", json={})
@@ -0,0 +1,39 @@
+"""
+tests/test_html_extract.py – unit tests for recovering HTML from raw model text.
+
+Run with:
+    pytest tests/test_html_extract.py -v
+"""
+from __future__ import annotations
+
+from app.services.html_extract import extract_html, strip_fences
+
+
+def test_strips_fences():
+    raw = "```html\n<!DOCTYPE html><html><body>x</body></html>\n```"
+    assert extract_html(raw) == "<!DOCTYPE html><html><body>x</body></html>"
+
+
+def test_drops_leading_prose():
+    assert extract_html("Sure! <html><b>a</b></html> done") == "<html><b>a</b></html>"
+
+
+def test_unwraps_truncated_json():
+    raw = '{"email_html": "<html>\\n<p>\\"hi\\"</p></html>'
+    assert extract_html(raw) == '<html>\n<p>"hi"</p></html>'
+
+
+def test_unwraps_email_html_object():
+    raw = '{"email_html": "<!DOCTYPE html>\\n<html><p>\\u00e9</p></html>", "notes": "x"}'
+    assert extract_html(raw) == "<!DOCTYPE html>\n<html><p>é</p></html>"
+
+
+def test_unwraps_other_json_key():
+    raw = '{"html": "<html><p>x</p></html>"}'
+    assert extract_html(raw) == "<html><p>x</p></html>"
+
+
+def test_strip_fences():
+    assert strip_fences('```json\n{"a": 1}\n```') == '{"a": 1}'
+    assert strip_fences("  ```\n<p>x</p>```  ") == "<p>x</p>"
+    assert strip_fences("no fences") == "no fences"
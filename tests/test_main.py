@@ -0,0 +1,118 @@
+"""
+tests/test_main.py – tests for app-level middleware.
+
+Run with:
+    pytest tests/test_main.py -v
+"""
+from __future__ import annotations
+
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.logging_config import JSONFormatter, RequestIDFilter, request_id_var
+from app.main import _NO_LOG_CONTEXT_PATHS, app
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+# ── RequestIDMiddleware ───────────────────────────────────────────────────────
+
+
+def test_request_id_echoed(client: TestClient):
+    """An incoming X-Request-ID is echoed back unchanged."""
+    resp = client.get("/v1/email/config", headers={"X-Request-ID": "abc-123"})
+    assert resp.headers["X-Request-ID"] == "abc-123"
+
+
+def test_request_id_generated(client: TestClient):
+    """A request ID is generated when the client does not send one."""
+    resp = client.get("/v1/email/config")
+    assert len(resp.headers["X-Request-ID"]) == 32
+
+
+def test_response_time_header(client: TestClient):
+    """Every HTTP response carries a numeric X-Response-Time-ms header."""
+    resp = client.get("/v1/email/config")
+    assert float(resp.headers["X-Response-Time-ms"]) >= 0
+
+
+def test_log_records_carry_request_id():
+    """RequestIDFilter stamps records with the ID bound for the current request."""
+    token = request_id_var.set("rid-42")
+    try:
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+        RequestIDFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+    assert record.request_id == "rid-42"
+
+
+def test_json_formatter_inlines_extra():
+    """JSONFormatter emits one JSON object with message, level and extra={...} keys."""
+    import json
+
+    record = logging.LogRecord("app.x", logging.INFO, __file__, 1, "hello %s", ("world",), None)
+    record.request_id = "rid-1"
+    out = json.loads(JSONFormatter().format(record))
+    assert out["message"] == "hello world"
+    assert out["level"] == "INFO"
+    assert out["request_id"] == "rid-1"
+    assert "args" not in out
+
+
+# ── Health probes ─────────────────────────────────────────────────────────────
+
+
+def test_health_probes_are_served(client: TestClient):
+    """The liveness and readiness probes are mounted and answer 200."""
+    health = client.get("/healthz")
+    assert health.status_code == 200
+    assert health.json()["status"] == "ok"
+    ready = client.get("/readyz")
+    assert ready.status_code == 200
+    assert "gemini_api_key_configured" in ready.json()["checks"]
+
+
+def test_no_log_context_paths_are_routed():
+    """Every path skipped for log context is one the app actually serves."""
+    assert _NO_LOG_CONTEXT_PATHS <= {route.path for route in app.routes}
+
+
+# ── CORS ──────────────────────────────────────────────────────────────────────
+
+
+def test_cors_preflight(client: TestClient):
+    """Preflight requests are answered directly with the allow-all policy."""
+    resp = client.options(
+        "/v1/email/send",
+        headers={
+            "Origin": "http://localhost:8080",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type",
+        },
+    )
+    assert resp.status_code == 204
+    assert resp.headers["Access-Control-Allow-Origin"] == "*"
+    assert resp.headers["Access-Control-Max-Age"] == "86400"
+    assert resp.headers["Access-Control-Allow-Headers"] == "content-type"
+    assert "POST" in resp.headers["Access-Control-Allow-Methods"]
+
+
+def test_cors_simple_request(client: TestClient):
+    """Cross-origin simple requests get Access-Control-Allow-Origin."""
+    resp = client.get("/v1/email/config", headers={"Origin": "http://localhost:8080"})
+    assert resp.headers["Access-Control-Allow-Origin"] == "*"
+
+
+def test_no_cors_header_without_origin(client: TestClient):
+    """Same-origin requests are not decorated with CORS headers."""
+    resp = client.get("/v1/email/config")
+    assert "Access-Control-Allow-Origin" not in resp.headers
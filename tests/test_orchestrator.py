@@ -0,0 +1,320 @@
+"""
+tests/test_orchestrator.py – unit tests for the orchestrator phases and HTML renderer.
+"""
+from __future__ import annotations
+
+import functools
+import re
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import orchestrator, prompting
+from app.services.cache import phase_cache
+from app.services.orchestrator import (
+    ExternalResearchProvider,
+    _compile_template,
+    _header_text_color,
+    _phase_execution,
+    _phase_production,
+    _phase_research_strategy,
+    _render_compiled,
+    _render_email_html,
+    orchestrate_campaign,
+)
+
+
+class TestCompiledTemplate:
+    def test_matches_str_format(self):
+        compiled = _compile_template("<a href='{url}'>{label}</a>{label}")
+        values = {"url": "/x", "label": "Go"}
+        assert _render_compiled(compiled, values) == "<a href='{url}'>{label}</a>{label}".format(**values)
+
+    def test_rendered_email_has_no_unfilled_fields(self, campaign_req):
+        html = _render_email_html(campaign_req, {"subject": "Hi", "headline": "Big sale"})
+        assert re.search(r"\{\w+\}", html) is None
+
+
+class TestHeaderTextColor:
+    def test_dark_brand_gets_white_text(self):
+        assert _header_text_color("#B22222") == "#ffffff"
+
+    def test_light_brand_gets_dark_text(self):
+        assert _header_text_color("#ffffff") == "#111827"
+
+    def test_unparseable_colour_falls_back_to_white(self):
+        assert _header_text_color("red") == "#ffffff"
+        assert _header_text_color("#abc") == "#ffffff"
+
+
+class TestRenderEmailHtml:
+    def test_brand_tokens_applied(self, campaign_req):
+        html = _render_email_html(campaign_req, {"subject": "Hi", "headline": "Big sale"})
+        assert html.startswith("<!DOCTYPE html>")
+        assert "font-family:Arial, sans-serif" in html
+        assert "#B22222" in html
+        assert "Big sale" in html
+        assert "{" not in html.split("<body", 1)[1]
+
+    def test_user_braces_are_escaped(self, campaign_req):
+        html = _render_email_html(campaign_req, {"headline": "Save {big}"})
+        assert "Save &#123;big&#125;" in html
+
+
+# ── Concurrent phases ─────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def gemini_concurrency(monkeypatch: pytest.MonkeyPatch):
+    """Allow 4 calls per fan-out: the barrier tests below need up to 4 calls in
+    flight at once, whatever gemini_max_concurrency is configured to."""
+    monkeypatch.setattr(orchestrator.settings, "gemini_max_concurrency", 4)
+
+
+class TestRunConcurrently:
+    def test_fan_out_is_capped_per_call(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(orchestrator.settings, "gemini_max_concurrency", 2)
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def call() -> None:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+        orchestrator._run_concurrently([call] * 6)
+
+        assert peak == 2
+
+
+def _email(n: int) -> dict[str, Any]:
+    return {
+        "email_name": f"Email {n}",
+        "subject_lines": [f"Subj-{n}a", f"Subj-{n}b"],
+        "preview_text_options": ["Preview a", "Preview b"],
+        "body_text": "Body",
+        "ctas": ["Shop Now"],
+        "send_timing": "Day 1",
+    }
+
+
+class TestPhaseExecution:
+    def test_all_emails_from_one_call_in_order(self, campaign_req):
+        """One call returns every email; each asset follows its beat's position."""
+        client = MagicMock()
+        client.generate_text.return_value = {
+            "parsed": {"emails": [_email(1), _email(2), _email(3)]}
+        }
+        blueprint = {"narrative_arc": ["Beat 1", "Beat 2", "Beat 3"]}
+
+        assets, raw = _phase_execution(campaign_req, blueprint, client)
+
+        assert client.generate_text.call_count == 1
+        prompt = client.generate_text.call_args.kwargs["prompt"]
+        assert "- Email 1: Beat 1\n- Email 2: Beat 2\n- Email 3: Beat 3" in prompt
+        assert [a.email_name for a in assets] == ["Email 1", "Email 2", "Email 3"]
+        assert [r["email_number"] for r in raw] == [1, 2, 3]
+
+    def test_schema_pins_email_count(self, campaign_req):
+        client = MagicMock()
+        client.generate_text.return_value = {
+            "parsed": {"emails": [_email(1), _email(2), _email(3)]}
+        }
+
+        _phase_execution(campaign_req, {"narrative_arc": []}, client)
+
+        emails = client.generate_text.call_args.kwargs["json_schema"]["properties"]["emails"]
+        assert emails["minItems"] == emails["maxItems"] == 3
+
+    def test_short_response_generates_missing_email(self, campaign_req):
+        """N-1 emails from the batch call: the missing one is generated on its own."""
+        client = MagicMock()
+        client.generate_text.side_effect = [
+            {"parsed": {"emails": [_email(1), _email(2)]}},
+            {"parsed": {"emails": [_email(3)]}},
+        ]
+        blueprint = {"narrative_arc": ["Beat 1", "Beat 2", "Beat 3"]}
+
+        assets, raw = _phase_execution(campaign_req, blueprint, client)
+
+        assert [a.email_name for a in assets] == ["Email 1", "Email 2", "Email 3"]
+        assert [r["email_number"] for r in raw] == [1, 2, 3]
+        retry = client.generate_text.call_args.kwargs
+        assert "- Email 3: Beat 3" in retry["prompt"]
+        assert "- Email 1:" not in retry["prompt"]
+        assert retry["json_schema"]["properties"]["emails"]["maxItems"] == 1
+
+    def test_missing_email_that_cannot_be_generated_raises(self, campaign_req):
+        client = MagicMock()
+        client.generate_text.side_effect = [
+            {"parsed": {"emails": [_email(1), _email(2)]}},
+            {"parsed": {"emails": []}},
+        ]
+
+        with pytest.raises(RuntimeError, match="email 3/3"):
+            _phase_execution(campaign_req, {"narrative_arc": []}, client)
+
+    def test_extra_emails_are_trimmed_to_requested_count(self, campaign_req):
+        client = MagicMock()
+        client.generate_text.return_value = {
+            "parsed": {"emails": [_email(n) for n in range(1, 6)]}
+        }
+
+        assets, _ = _phase_execution(campaign_req, {"narrative_arc": []}, client)
+
+        assert [a.email_number for a in assets] == [1, 2, 3]
+
+
+@pytest.mark.usefixtures("gemini_concurrency")
+class TestPhaseProduction:
+    def test_html_generated_concurrently_in_order(self, campaign_req):
+        """All production calls are in flight at once; HTML lands on the right asset."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def generate_text(**kwargs: Any) -> dict[str, Any]:
+            barrier.wait()
+            n = kwargs["prompt"].split("Subj-", 1)[1][0]
+            html = f"<!DOCTYPE html><html><body>{n}</body></html>"
+            return {"text": html, "parsed": {"email_html": html}}
+
+        client = MagicMock()
+        client.generate_text.side_effect = generate_text
+        blueprint = {"narrative_arc": ["Beat 1", "Beat 2", "Beat 3"]}
+        execution = MagicMock()
+        execution.generate_text.return_value = {
+            "parsed": {"emails": [_email(1), _email(2), _email(3)]}
+        }
+        assets, raw = _phase_execution(campaign_req, blueprint, execution)
+
+        produced = _phase_production(campaign_req, assets, raw, client)
+
+        assert [a.html for a in produced] == [
+            f"<!DOCTYPE html><html><body>{n}</body></html>" for n in (1, 2, 3)
+        ]
+
+
+@pytest.mark.usefixtures("gemini_concurrency")
+class TestPhaseResearchStrategy:
+    def test_external_search_overlaps_llm_call(self, campaign_req):
+        """A real external provider runs while the research+strategy call is in flight."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class Provider(ExternalResearchProvider):
+            def search(self, query: str) -> list[dict[str, Any]]:
+                barrier.wait()
+                return [{"title": query}]
+
+        def generate_text(**kwargs: Any) -> dict[str, Any]:
+            barrier.wait()
+            return {
+                "parsed": {
+                    "research": {"audience_insights": ["x"]},
+                    "blueprint": {"campaign_angle": "Angle", "narrative_arc": ["Beat 1"]},
+                }
+            }
+
+        client = MagicMock()
+        client.generate_text.side_effect = generate_text
+
+        blueprint, raw = _phase_research_strategy(campaign_req, client, Provider())
+
+        assert client.generate_text.call_count == 1
+        assert blueprint.campaign_angle == "Angle"
+        assert raw["narrative_arc"] == ["Beat 1"]
+
+    def test_merged_strategy_phase_has_no_timing(self, campaign_req, mock_gemini_client):
+        resp = orchestrate_campaign(campaign_req, "rid", mock_gemini_client, skip_clarify=True)
+
+        assert resp.metadata.timings.research_ms is not None
+        assert resp.metadata.timings.strategy_ms is None
+
+
+@pytest.mark.usefixtures("gemini_concurrency")
+class TestCritiqueOverlap:
+    def test_critique_runs_alongside_production(self, campaign_req, mock_gemini_client):
+        """The critique call is in flight together with the three HTML calls."""
+        barrier = threading.Barrier(4, timeout=5)
+        respond = mock_gemini_client.generate_text.side_effect
+        overlapping = {id(prompting.HTML_OUTPUT_SCHEMA), id(prompting.CRITIQUE_SCHEMA)}
+
+        def generate_text(**kwargs: Any) -> dict[str, Any]:
+            if id(kwargs["json_schema"]) in overlapping:
+                barrier.wait()
+            return respond(**kwargs)
+
+        mock_gemini_client.generate_text.side_effect = generate_text
+
+        resp = orchestrate_campaign(campaign_req, "rid", mock_gemini_client, skip_clarify=True)
+
+        assert resp.critique.score > 0
+        assert all(a.html for a in resp.assets)
+
+    def test_critique_sees_pre_html_assets_when_started_late(
+        self, monkeypatch: pytest.MonkeyPatch, campaign_req, mock_gemini_client
+    ):
+        """Critique starting only after Phase 5 still gets the assets it was submitted with."""
+        seen: list[list[str | None]] = []
+        critique = orchestrator._phase_critique
+
+        def spy(req, blueprint_raw, assets, raw_emails, client):
+            seen.append([a.html for a in assets])
+            return critique(req, blueprint_raw, assets, raw_emails, client)
+
+        class _Deferred:
+            def __init__(self, fn, *args):
+                self._run = functools.partial(fn, *args)
+
+            def result(self):
+                return self._run()
+
+        monkeypatch.setattr(orchestrator, "_phase_critique", spy)
+        monkeypatch.setattr(orchestrator, "_start", _Deferred)
+
+        resp = orchestrate_campaign(campaign_req, "rid", mock_gemini_client, skip_clarify=True)
+
+        assert all(a.html for a in resp.assets)
+        assert seen == [[None, None, None]]
+        assert resp.metadata.timings.critique_ms is not None
+
+
+class TestPhaseCache:
+    def setup_method(self):
+        phase_cache.clear()
+
+    def teardown_method(self):
+        phase_cache.clear()
+
+    def test_repeat_brief_reuses_low_temperature_phases(self, campaign_req, mock_gemini_client):
+        """Clarify and research+strategy are served from cache; creative phases are not."""
+        orchestrate_campaign(campaign_req, "rid-1", mock_gemini_client)
+        first_calls = mock_gemini_client.generate_text.call_count
+        orchestrate_campaign(campaign_req, "rid-2", mock_gemini_client)
+
+        assert mock_gemini_client.generate_text.call_count - first_calls == first_calls - 2
+
+    def test_cached_result_is_not_shared_mutable_state(self, campaign_req, mock_gemini_client):
+        _, raw = _phase_research_strategy(campaign_req, mock_gemini_client)
+        raw["narrative_arc"].append("mutated")
+
+        _, again = _phase_research_strategy(campaign_req, mock_gemini_client)
+
+        assert "mutated" not in again["narrative_arc"]
+        assert mock_gemini_client.generate_text.call_count == 1
+
+
+class TestPromptPrefix:
+    def test_production_prompts_share_leading_text(self, campaign_req):
+        """Only the tail differs between calls, so the prefix is cacheable."""
+        req = campaign_req
+        html_a = prompting.build_production_prompt(req, _email(1))
+        html_b = prompting.build_production_prompt(req, _email(2))
+        shared = html_a.index("CONTENT TO ENCODE")
+        assert html_a[:shared] == html_b[:shared]
+        assert "STRUCTURE & CODE PATTERNS" in html_a[:shared]
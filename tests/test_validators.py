@@ -167,6 +167,11 @@ class TestCheckDiscountCeiling:
         assert not result.passed
         assert len(result.risk_flags) == 1
 
+    def test_spelled_out_percent_fails(self):
+        result = check_discount_ceiling("Get 30 Percent off today!", 25.0, "test")
+        assert not result.passed
+        assert "[30.0]" in result.issues[0]
+
 
 # ── Aggregate validators ───────────────────────────────────────────────────────
 